@@ -47,10 +47,11 @@ except ImportError:
         def config(self) -> Config:
             """Load and cache configuration."""
             if self._config is None:
-                # First try to get existing config
-                self._config = get_config()
+                # First try the shared config, unless a specific file was requested
+                if self.config_path is None:
+                    self._config = get_config()
                 if self._config is None:
-                    # If no existing config, load from file
+                    # If no shared config, load from file
                     self._config = load_config(self.config_path)
                 logger.info("Configuration loaded successfully")
             return self._config
@@ -156,7 +157,7 @@ except ImportError:
                 
                 # Create temporary file for legacy SOAP client
                 with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                    yaml.dump(legacy_data, f)
+                    yaml.safe_dump(legacy_data, f)
                     temp_config_path = f.name
                 
                 try:
@@ -7,16 +7,24 @@ settings including API selection preferences and fallback configurations.
 """
 
 import os
+import sys
 import logging
+import functools
 import yaml
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, fields
+from typing import Optional, Dict, Any, Tuple, Callable
 
 from .exceptions import ConfigurationError
 
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when available, pure-Python fallback otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML keyed by (absolute path, mtime_ns, size) so unchanged files are not reparsed
+_YAML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
 
 @dataclass
 class AuthConfig:
@@ -158,9 +166,124 @@ class Config:
         }
 
 
+_SECTION_CLASSES = {
+    'auth': AuthConfig,
+    'api': APIConfig,
+    'cache': CacheConfig,
+    'logging': LoggingConfig,
+    'defaults': DefaultsConfig,
+    'unified': UnifiedClientConfig,
+}
+
+_SECTION_FIELDS = {
+    name: frozenset(f.name for f in fields(section_class))
+    for name, section_class in _SECTION_CLASSES.items()
+}
+
+_REQUIRED_AUTH_FIELDS = ('network_code', 'client_id', 'client_secret', 'refresh_token')
+
+# Short, frequently repeated string settings; credentials are left un-interned
+_INTERNED_FIELDS = (
+    ('auth', 'network_code'),
+    ('logging', 'level'),
+    ('cache', 'backend'),
+    ('defaults', 'format'),
+    ('unified', 'api_preference'),
+    ('unified', 'retry_strategy'),
+)
+
+
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge override into base in place, with override values winning."""
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            base[key] = _deep_merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+def _env_bool(value: str) -> bool:
+    """Interpret an environment variable as a boolean flag."""
+    return value.lower() == 'true'
+
+
+_REQUIRED_ENV_VARS = (
+    'GAM_NETWORK_CODE',
+    'GAM_CLIENT_ID',
+    'GAM_CLIENT_SECRET',
+    'GAM_REFRESH_TOKEN',
+)
+
+# (section, field, environment variable, converter) for every env-configurable setting
+_ENV_MAP: Tuple[Tuple[str, str, str, Callable[[str], Any]], ...] = (
+    ('auth', 'network_code', 'GAM_NETWORK_CODE', str),
+    ('auth', 'client_id', 'GAM_CLIENT_ID', str),
+    ('auth', 'client_secret', 'GAM_CLIENT_SECRET', str),
+    ('auth', 'refresh_token', 'GAM_REFRESH_TOKEN', str),
+    ('auth', 'service_account_path', 'GAM_SERVICE_ACCOUNT_PATH', str),
+    ('auth', 'impersonate_user', 'GAM_IMPERSONATE_USER', str),
+    ('api', 'prefer_rest', 'GAM_PREFER_REST', _env_bool),
+    ('api', 'timeout', 'GAM_TIMEOUT', int),
+    ('api', 'max_retries', 'GAM_MAX_RETRIES', int),
+    ('api', 'retry_delay', 'GAM_RETRY_DELAY', float),
+    ('cache', 'enabled', 'GAM_CACHE_ENABLED', _env_bool),
+    ('cache', 'backend', 'GAM_CACHE_BACKEND', str),
+    ('cache', 'ttl', 'GAM_CACHE_TTL', int),
+    ('cache', 'directory', 'GAM_CACHE_DIRECTORY', str),
+    ('logging', 'level', 'GAM_LOG_LEVEL', str),
+    ('logging', 'file', 'GAM_LOG_FILE', str),
+    ('logging', 'directory', 'GAM_LOG_DIRECTORY', str),
+    ('logging', 'include_console', 'GAM_LOG_CONSOLE', _env_bool),
+    ('defaults', 'days_back', 'GAM_DEFAULT_DAYS_BACK', int),
+    ('defaults', 'format', 'GAM_DEFAULT_FORMAT', str),
+    ('defaults', 'max_rows_preview', 'GAM_DEFAULT_MAX_ROWS_PREVIEW', int),
+    ('defaults', 'max_pages', 'GAM_DEFAULT_MAX_PAGES', int),
+    ('defaults', 'timeout', 'GAM_DEFAULT_TIMEOUT', int),
+    ('unified', 'api_preference', 'GAM_UNIFIED_API_PREFERENCE', str),
+    ('unified', 'enable_fallback', 'GAM_UNIFIED_ENABLE_FALLBACK', _env_bool),
+    ('unified', 'enable_performance_tracking', 'GAM_UNIFIED_PERFORMANCE_TRACKING', _env_bool),
+    ('unified', 'performance_threshold', 'GAM_UNIFIED_PERFORMANCE_THRESHOLD', float),
+    ('unified', 'complexity_threshold', 'GAM_UNIFIED_COMPLEXITY_THRESHOLD', int),
+    ('unified', 'circuit_breaker_threshold', 'GAM_UNIFIED_CIRCUIT_BREAKER_THRESHOLD', int),
+    ('unified', 'circuit_breaker_timeout', 'GAM_UNIFIED_CIRCUIT_BREAKER_TIMEOUT', float),
+    ('unified', 'max_retries', 'GAM_UNIFIED_MAX_RETRIES', int),
+    ('unified', 'base_delay', 'GAM_UNIFIED_BASE_DELAY', float),
+    ('unified', 'max_delay', 'GAM_UNIFIED_MAX_DELAY', float),
+    ('unified', 'backoff_multiplier', 'GAM_UNIFIED_BACKOFF_MULTIPLIER', float),
+    ('unified', 'retry_strategy', 'GAM_UNIFIED_RETRY_STRATEGY', str),
+)
+
+
+# Candidate config locations in priority order; "~" is expanded at lookup time
+_AGENT_CONFIG_CANDIDATES = (
+    "config/agent_config.yaml",
+    "agent_config.yaml",
+    "~/.config/gam-api/agent_config.yaml",
+)
+
+_LEGACY_CONFIG_CANDIDATES = (
+    "googleads.yaml",
+    "~/.googleads.yaml",
+    os.path.join(os.path.dirname(__file__), "..", "..", "googleads.yaml"),
+)
+
+
+def _first_existing(candidates: Tuple[str, ...]) -> Optional[str]:
+    """Return the first candidate path that exists, stopping at the first hit."""
+    for path in candidates:
+        path = os.path.expanduser(path)
+        if os.path.exists(path):
+            return path
+    return None
+
+
 class ConfigLoader:
     """Configuration loader that supports multiple formats."""
     
+    # Shared loader used by load_config() and get_config()
+    _instance: Optional['ConfigLoader'] = None
+    
     def __init__(self):
         """Initialize configuration loader."""
         self._config: Optional[Config] = None
@@ -175,6 +298,8 @@ class ConfigLoader:
         3. googleads.yaml (legacy format)
         4. Environment variables
         
+        Environment variables also fill any settings a config file leaves unset.
+        
         Args:
             config_path: Optional explicit path to config file
             
@@ -224,35 +349,27 @@ class ConfigLoader:
     
     def _find_agent_config(self) -> Optional[str]:
         """Find agent configuration file."""
-        possible_paths = [
-            "config/agent_config.yaml",
-            "agent_config.yaml",
-            os.path.expanduser("~/.config/gam-api/agent_config.yaml")
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        return None
+        return _first_existing(_AGENT_CONFIG_CANDIDATES)
     
     def _find_legacy_config(self) -> Optional[str]:
         """Find legacy configuration file."""
-        possible_paths = [
-            "googleads.yaml",
-            os.path.expanduser("~/.googleads.yaml"),
-            os.path.join(os.path.dirname(__file__), "..", "..", "googleads.yaml")
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        return None
+        return _first_existing(_LEGACY_CONFIG_CANDIDATES)
+    
+    def _load_yaml_file(self, config_path: str) -> Dict[str, Any]:
+        """Parse a YAML configuration file, reusing the result while the file is unchanged."""
+        st = os.stat(config_path)
+        key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+        data = _YAML_CACHE.get(key)
+        if data is None:
+            with open(config_path, 'rb') as f:
+                data = yaml.load(f, Loader=_YAML_LOADER)
+            _YAML_CACHE[key] = data
+        return data
     
     def _load_from_file(self, config_path: str) -> Config:
         """Load configuration from any file, detecting format."""
         try:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = self._load_yaml_file(config_path)
             
             # Detect format by checking structure
             if 'ad_manager' in data:
@@ -270,8 +387,7 @@ class ConfigLoader:
     def _load_agent_config(self, config_path: str) -> Config:
         """Load new agent configuration format."""
         try:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = self._load_yaml_file(config_path)
             return self._parse_agent_format(data)
         except Exception as e:
             raise ConfigurationError(f"Failed to load agent config: {e}")
@@ -279,204 +395,108 @@ class ConfigLoader:
     def _load_legacy_config(self, config_path: str) -> Config:
         """Load legacy googleads.yaml format."""
         try:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = self._load_yaml_file(config_path)
             return self._parse_legacy_format(data)
         except Exception as e:
             raise ConfigurationError(f"Failed to load legacy config: {e}")
     
     def _load_from_env(self) -> Config:
         """Load configuration from environment variables."""
-        required_vars = [
-            'GAM_NETWORK_CODE',
-            'GAM_CLIENT_ID', 
-            'GAM_CLIENT_SECRET',
-            'GAM_REFRESH_TOKEN'
-        ]
-        
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
+        missing_vars = [var for var in _REQUIRED_ENV_VARS if not os.environ.get(var)]
         if missing_vars:
             raise ConfigurationError(
                 f"Missing required environment variables: {', '.join(missing_vars)}"
             )
         
-        auth = AuthConfig(
-            network_code=os.getenv('GAM_NETWORK_CODE'),
-            client_id=os.getenv('GAM_CLIENT_ID'),
-            client_secret=os.getenv('GAM_CLIENT_SECRET'),
-            refresh_token=os.getenv('GAM_REFRESH_TOKEN'),
-            service_account_path=os.getenv('GAM_SERVICE_ACCOUNT_PATH'),
-            impersonate_user=os.getenv('GAM_IMPERSONATE_USER')
-        )
-        
-        api = APIConfig(
-            prefer_rest=os.getenv('GAM_PREFER_REST', 'true').lower() == 'true',
-            timeout=int(os.getenv('GAM_TIMEOUT', '30')),
-            max_retries=int(os.getenv('GAM_MAX_RETRIES', '3')),
-            retry_delay=float(os.getenv('GAM_RETRY_DELAY', '1.0'))
-        )
-        
-        cache = CacheConfig(
-            enabled=os.getenv('GAM_CACHE_ENABLED', 'true').lower() == 'true',
-            backend=os.getenv('GAM_CACHE_BACKEND', 'file'),
-            ttl=int(os.getenv('GAM_CACHE_TTL', '3600')),
-            directory=os.getenv('GAM_CACHE_DIRECTORY', 'cache')
-        )
-        
-        logging_config = LoggingConfig(
-            level=os.getenv('GAM_LOG_LEVEL', 'INFO'),
-            file=os.getenv('GAM_LOG_FILE'),
-            directory=os.getenv('GAM_LOG_DIRECTORY', 'logs'),
-            include_console=os.getenv('GAM_LOG_CONSOLE', 'true').lower() == 'true'
-        )
-        
-        defaults = DefaultsConfig(
-            days_back=int(os.getenv('GAM_DEFAULT_DAYS_BACK', '30')),
-            format=os.getenv('GAM_DEFAULT_FORMAT', 'json'),
-            max_rows_preview=int(os.getenv('GAM_DEFAULT_MAX_ROWS_PREVIEW', '10')),
-            max_pages=int(os.getenv('GAM_DEFAULT_MAX_PAGES', '5')),
-            timeout=int(os.getenv('GAM_DEFAULT_TIMEOUT', '300'))
-        )
+        return self._build_config(self._env_sections())
+    
+    def _env_sections(self, strict: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect the settings set in environment variables, grouped by section.
         
-        unified = UnifiedClientConfig(
-            api_preference=os.getenv('GAM_UNIFIED_API_PREFERENCE'),
-            enable_fallback=os.getenv('GAM_UNIFIED_ENABLE_FALLBACK', 'true').lower() == 'true',
-            enable_performance_tracking=os.getenv('GAM_UNIFIED_PERFORMANCE_TRACKING', 'true').lower() == 'true',
-            performance_threshold=float(os.getenv('GAM_UNIFIED_PERFORMANCE_THRESHOLD', '0.8')),
-            complexity_threshold=int(os.getenv('GAM_UNIFIED_COMPLEXITY_THRESHOLD', '10')),
-            circuit_breaker_threshold=int(os.getenv('GAM_UNIFIED_CIRCUIT_BREAKER_THRESHOLD', '5')),
-            circuit_breaker_timeout=float(os.getenv('GAM_UNIFIED_CIRCUIT_BREAKER_TIMEOUT', '60.0')),
-            max_retries=int(os.getenv('GAM_UNIFIED_MAX_RETRIES', '3')),
-            base_delay=float(os.getenv('GAM_UNIFIED_BASE_DELAY', '1.0')),
-            max_delay=float(os.getenv('GAM_UNIFIED_MAX_DELAY', '60.0')),
-            backoff_multiplier=float(os.getenv('GAM_UNIFIED_BACKOFF_MULTIPLIER', '2.0')),
-            retry_strategy=os.getenv('GAM_UNIFIED_RETRY_STRATEGY', 'exponential')
-        )
+        Args:
+            strict: Raise on values that cannot be converted; when False they
+                    are skipped with a warning so they cannot break a config file
+        """
+        env = os.environ
+        sections: Dict[str, Dict[str, Any]] = {}
+        for section, field_name, var, convert in _ENV_MAP:
+            value = env.get(var)
+            if value is None:
+                continue
+            try:
+                sections.setdefault(section, {})[field_name] = convert(value)
+            except ValueError:
+                if strict:
+                    raise
+                logger.warning(f"Ignoring invalid value for {var}: {value!r}")
+        return sections
+    
+    def _build_config(self, sections: Dict[str, Dict[str, Any]]) -> Config:
+        """Build a Config from per-section settings, using defaults for anything unset."""
+        for section, field_name in _INTERNED_FIELDS:
+            value = sections.get(section, {}).get(field_name)
+            if isinstance(value, str):
+                sections[section][field_name] = sys.intern(value)
         
-        return Config(
-            auth=auth,
-            api=api,
-            cache=cache,
-            logging=logging_config,
-            defaults=defaults,
-            unified=unified
-        )
+        # Missing credentials are reported by validation rather than at load time
+        auth = dict.fromkeys(_REQUIRED_AUTH_FIELDS)
+        auth.update(sections.get('auth', {}))
+        built = {
+            name: section_class(**sections.get(name, {}))
+            for name, section_class in _SECTION_CLASSES.items()
+            if name != 'auth'
+        }
+        return Config(auth=AuthConfig(**auth), **built)
+    
+    def _file_sections(self, auth: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Group file settings by section, keeping only known fields that are set."""
+        sections = {'auth': {k: v for k, v in auth.items() if v is not None}}
+        for name, known in _SECTION_FIELDS.items():
+            if name == 'auth':
+                continue
+            section_data = data.get(name) or {}
+            sections[name] = {k: v for k, v in section_data.items() if k in known and v is not None}
+        return sections
     
     def _parse_agent_format(self, data: Dict[str, Any]) -> Config:
-        """Parse new agent configuration format."""
+        """Parse new agent configuration format, with environment variables filling unset fields."""
         try:
             auth_data = data.get('auth', {})
             oauth2_data = auth_data.get('oauth2', {})
+            service_account_data = auth_data.get('service_account', {})
             
-            auth = AuthConfig(
-                network_code=auth_data.get('network_code'),
-                client_id=oauth2_data.get('client_id'),
-                client_secret=oauth2_data.get('client_secret'),
-                refresh_token=oauth2_data.get('refresh_token'),
-                service_account_path=auth_data.get('service_account', {}).get('path'),
-                impersonate_user=auth_data.get('service_account', {}).get('impersonate_user')
-            )
-            
-            api_data = data.get('api', {})
-            api = APIConfig(
-                prefer_rest=api_data.get('prefer_rest', True),
-                timeout=api_data.get('timeout', 30),
-                max_retries=api_data.get('max_retries', 3),
-                retry_delay=api_data.get('retry_delay', 1.0)
-            )
-            
-            cache_data = data.get('cache', {})
-            cache = CacheConfig(
-                enabled=cache_data.get('enabled', True),
-                backend=cache_data.get('backend', 'file'),
-                ttl=cache_data.get('ttl', 3600),
-                directory=cache_data.get('directory', 'cache')
-            )
-            
-            logging_data = data.get('logging', {})
-            logging_config = LoggingConfig(
-                level=logging_data.get('level', 'INFO'),
-                file=logging_data.get('file'),
-                directory=logging_data.get('directory', 'logs'),
-                include_console=logging_data.get('include_console', True)
-            )
-            
-            defaults_data = data.get('defaults', {})
-            defaults = DefaultsConfig(
-                days_back=defaults_data.get('days_back', 30),
-                format=defaults_data.get('format', 'json'),
-                max_rows_preview=defaults_data.get('max_rows_preview', 10),
-                max_pages=defaults_data.get('max_pages', 5),
-                timeout=defaults_data.get('timeout', 300)
-            )
-            
-            unified_data = data.get('unified', {})
-            unified = UnifiedClientConfig(
-                api_preference=unified_data.get('api_preference'),
-                enable_fallback=unified_data.get('enable_fallback', True),
-                enable_performance_tracking=unified_data.get('enable_performance_tracking', True),
-                performance_threshold=unified_data.get('performance_threshold', 0.8),
-                complexity_threshold=unified_data.get('complexity_threshold', 10),
-                circuit_breaker_threshold=unified_data.get('circuit_breaker_threshold', 5),
-                circuit_breaker_timeout=unified_data.get('circuit_breaker_timeout', 60.0),
-                max_retries=unified_data.get('max_retries', 3),
-                base_delay=unified_data.get('base_delay', 1.0),
-                max_delay=unified_data.get('max_delay', 60.0),
-                backoff_multiplier=unified_data.get('backoff_multiplier', 2.0),
-                retry_strategy=unified_data.get('retry_strategy', 'exponential'),
-                operation_preferences=unified_data.get('operation_preferences'),
-                operation_timeouts=unified_data.get('operation_timeouts'),
-                operation_retry_configs=unified_data.get('operation_retry_configs')
-            )
-            
-            return Config(
-                auth=auth,
-                api=api,
-                cache=cache,
-                logging=logging_config,
-                defaults=defaults,
-                unified=unified
-            )
+            file_sections = self._file_sections({
+                'network_code': auth_data.get('network_code'),
+                'client_id': oauth2_data.get('client_id'),
+                'client_secret': oauth2_data.get('client_secret'),
+                'refresh_token': oauth2_data.get('refresh_token'),
+                'service_account_path': service_account_data.get('path'),
+                'impersonate_user': service_account_data.get('impersonate_user')
+            }, data)
+            return self._build_config(_deep_merge(self._env_sections(strict=False), file_sections))
             
         except Exception as e:
             raise ConfigurationError(f"Failed to parse agent configuration: {e}")
     
     def _parse_legacy_format(self, data: Dict[str, Any]) -> Config:
-        """Parse legacy googleads.yaml format."""
+        """Parse legacy googleads.yaml format, with environment variables filling unset fields."""
         try:
             ad_manager_data = data.get('ad_manager', {})
             
-            auth = AuthConfig(
-                network_code=ad_manager_data.get('network_code'),
-                client_id=ad_manager_data.get('client_id'),
-                client_secret=ad_manager_data.get('client_secret'),
-                refresh_token=ad_manager_data.get('refresh_token')
-            )
-            
-            # Use defaults for other settings in legacy format
-            api = APIConfig()
-            cache = CacheConfig()
-            logging_config = LoggingConfig()
-            defaults = DefaultsConfig()
-            unified = UnifiedClientConfig()  # Use all defaults
-            
-            return Config(
-                auth=auth,
-                api=api,
-                cache=cache,
-                logging=logging_config,
-                defaults=defaults,
-                unified=unified
-            )
+            # The legacy format only carries credentials
+            file_sections = self._file_sections({
+                'network_code': ad_manager_data.get('network_code'),
+                'client_id': ad_manager_data.get('client_id'),
+                'client_secret': ad_manager_data.get('client_secret'),
+                'refresh_token': ad_manager_data.get('refresh_token')
+            }, {})
+            return self._build_config(_deep_merge(self._env_sections(strict=False), file_sections))
             
         except Exception as e:
             raise ConfigurationError(f"Failed to parse legacy configuration: {e}")
 
 
-# Global configuration loader instance
-_config_loader: Optional[ConfigLoader] = None
-
-
 def load_config(config_path: Optional[str] = None) -> Config:
     """
     Load configuration using global loader instance.
@@ -487,22 +507,37 @@ def load_config(config_path: Optional[str] = None) -> Config:
     Returns:
         Loaded configuration object
     """
-    global _config_loader
-    if _config_loader is None:
-        _config_loader = ConfigLoader()
-    return _config_loader.load_config(config_path)
+    loader = ConfigLoader._instance
+    if loader is None:
+        loader = ConfigLoader._instance = ConfigLoader()
+    return loader.load_config(config_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_config() -> Config:
+    """Load the shared configuration once; failures are not cached."""
+    return load_config()
 
 
 def get_config() -> Optional[Config]:
-    """Get current configuration if loaded."""
-    global _config_loader
-    return _config_loader._config if _config_loader else None
+    """
+    Get the shared configuration, loading it on first use.
+    
+    Returns:
+        Loaded configuration object, or None if it cannot be loaded
+    """
+    try:
+        return _shared_config()
+    except ConfigurationError as e:
+        logger.debug(f"Configuration not available: {e}")
+        return None
 
 
 def reset_config():
     """Reset configuration loader to force reload."""
-    global _config_loader
-    _config_loader = None
+    ConfigLoader._instance = None
+    _shared_config.cache_clear()
+    _YAML_CACHE.clear()
 
 
 # Re-export for backward compatibility
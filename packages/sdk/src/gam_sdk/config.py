@@ -8,7 +8,7 @@ reading, writing, validation, and environment management.
 import os
 import yaml
 import logging
-from typing import Optional, Dict, Any, Union, List
+from typing import Optional, Dict, Any, Union, List, Mapping
 from pathlib import Path
 from copy import deepcopy
 
@@ -108,6 +108,35 @@ class ConfigManager:
         
         return self
     
+    def set_many(self, updates: Mapping[str, Any]) -> 'ConfigManager':
+        """
+        Set several configuration values at once using dot notation.
+        
+        Pending changes are recorded with a single dict update before the
+        values are applied to the current config.
+        
+        Args:
+            updates: Mapping of configuration keys to values
+            
+        Returns:
+            Self for chaining
+            
+        Example:
+            config = manager.set_many({
+                'gam.network_code': '12345678',
+                'api.timeout': 60
+            })
+        """
+        self._changes.update(updates)
+        
+        for key, value in updates.items():
+            try:
+                self._apply_change(key, value)
+            except Exception as e:
+                logger.warning(f"Could not immediately apply config change {key}={value}: {e}")
+        
+        return self
+    
     def _apply_change(self, key: str, value: Any) -> None:
         """Apply a configuration change to the current config object."""
         keys = key.split('.')
@@ -140,10 +169,7 @@ class ConfigManager:
                 'logging.level': 'DEBUG'
             })
         """
-        for key, value in config_dict.items():
-            self.set(key, value)
-        
-        return self
+        return self.set_many(config_dict)
     
     def load_from_file(self, file_path: Union[str, Path]) -> 'ConfigManager':
         """
@@ -175,8 +201,7 @@ class ConfigManager:
                     raise ConfigError(f"Unsupported config file format: {file_path.suffix}")
             
             # Update config with loaded data
-            for key, value in self._flatten_dict(config_data).items():
-                self.set(key, value)
+            self.set_many(self._flatten_dict(config_data))
             
             logger.info(f"Configuration loaded from: {file_path}")
             return self
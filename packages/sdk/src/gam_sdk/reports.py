@@ -9,10 +9,12 @@ import json
 import csv
 import io
 import logging
-from typing import Optional, List, Dict, Any, Union, Callable
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Union, Callable, Tuple, TextIO
 from datetime import datetime, date, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from gam_api.config import Config
@@ -24,6 +26,75 @@ from .exceptions import ReportError, ValidationError, SDKError
 
 logger = logging.getLogger(__name__)
 
+# CSV export tuning: rows handed to writerows() per call and file buffer size
+CSV_BATCH_SIZE = 1000
+CSV_BUFFER_SIZE = 1 << 20
+
+# Comparison operators accepted by ReportResult.filter_expr
+FILTER_OPERATORS = {
+    'gt': np.greater,
+    'ge': np.greater_equal,
+    'lt': np.less,
+    'le': np.less_equal,
+    'eq': np.equal,
+    'ne': np.not_equal,
+}
+
+
+def _convert_metric_value(value: Any) -> Any:
+    """Convert a raw metric value to int/float, leaving it untouched if not numeric."""
+    try:
+        if '.' in str(value):
+            return float(value)
+        return int(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def _parse_metric_column(raw: np.ndarray) -> np.ndarray:
+    """
+    Parse a column of raw metric values in one vectorized pass.
+    
+    Tries int64, then float64, and only falls back to converting values one
+    by one when the column contains non-numeric entries or integers too
+    large for int64. Missing values become NaN so numeric columns with gaps
+    still parse as float64.
+    """
+    as_text = raw.astype(str)
+    as_text[np.equal(raw, None)] = 'nan'
+    for dtype in (np.int64, np.float64):
+        try:
+            return as_text.astype(dtype)
+        except OverflowError:
+            break
+        except (ValueError, TypeError):
+            continue
+    
+    parsed = np.empty(len(raw), dtype=object)
+    parsed[:] = [_convert_metric_value(v) for v in raw]
+    return parsed
+
+
+def _blank_missing(values: np.ndarray) -> np.ndarray:
+    """Replace missing values (None/NaN) with empty strings for CSV output."""
+    missing = pd.isna(values)
+    if not missing.any():
+        return values
+    blanked = values.astype(object)
+    blanked[missing] = ''
+    return blanked
+
+
+@lru_cache(maxsize=32)
+def _days_back_range(today: date, days: int) -> Tuple[date, date]:
+    """Get the (start, end) dates for a range of ``days`` ending ``today``."""
+    return today - timedelta(days=days), today
+
+
+def _buffered_writer(file_path: Path):
+    """Open a text file for CSV output with a large write buffer."""
+    return open(file_path, 'w', buffering=CSV_BUFFER_SIZE, newline='', encoding='utf-8')
+
 
 class ReportResult:
     """
@@ -31,6 +102,11 @@ class ReportResult:
     
     Provides fluent interface for working with report data including
     export to various formats, data transformation, and analysis.
+    
+    Rows are parsed lazily into one NumPy array per column; filtering,
+    sorting, slicing and exports operate on those arrays. Results derived
+    from another result are built from columns only and materialize their
+    row dicts on first access to ``rows``.
     """
     
     def __init__(self, 
@@ -47,12 +123,31 @@ class ReportResult:
             metric_headers: Metric column names
             metadata: Optional report metadata
         """
-        self.rows = rows
+        self._rows = rows
+        self._columns = None
         self.dimension_headers = dimension_headers
         self.metric_headers = metric_headers
         self.metadata = metadata or {}
         self._dataframe = None
     
+    @classmethod
+    def _from_columns(cls,
+                      columns: Dict[str, np.ndarray],
+                      dimension_headers: List[str],
+                      metric_headers: List[str],
+                      metadata: Optional[Dict[str, Any]] = None) -> 'ReportResult':
+        """Create a result directly from parsed column arrays."""
+        result = cls(None, dimension_headers, metric_headers, metadata)
+        result._columns = columns
+        return result
+    
+    @property
+    def rows(self) -> List[Dict[str, Any]]:
+        """Get data rows in the GAM API row format."""
+        if self._rows is None:
+            self._rows = self._build_rows()
+        return self._rows
+    
     @property
     def headers(self) -> List[str]:
         """Get all column headers (dimensions + metrics)."""
@@ -61,13 +156,36 @@ class ReportResult:
     @property
     def row_count(self) -> int:
         """Get number of data rows."""
-        return len(self.rows)
+        if self._rows is not None:
+            return len(self._rows)
+        return len(next(iter(self._columns.values()), ()))
     
     @property
     def column_count(self) -> int:
         """Get number of columns."""
         return len(self.headers)
     
+    def column_values(self, name: str) -> np.ndarray:
+        """
+        Get the values of one column without building a DataFrame.
+        
+        Args:
+            name: Column name
+            
+        Returns:
+            Read-only NumPy array backing the column
+            
+        Raises:
+            ReportError: If the column does not exist
+        """
+        try:
+            values = self._column_arrays()[name]
+        except KeyError:
+            raise ReportError(f"Unknown column '{name}'. Available: {', '.join(self.headers)}")
+        
+        values.setflags(write=False)
+        return values
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary format.
@@ -87,68 +205,132 @@ class ReportResult:
             }
         }
     
+    def _build_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Parse rows into one contiguous array per column.
+        
+        Values are written positionally into preallocated arrays so the
+        rows are walked once; metric columns are then parsed as a whole.
+        """
+        n_rows = len(self._rows)
+        n_dims = len(self.dimension_headers)
+        n_metrics = len(self.metric_headers)
+        
+        dimension_cols = [np.empty(n_rows, dtype=object) for _ in range(n_dims)]
+        metric_cols = [np.empty(n_rows, dtype=object) for _ in range(n_metrics)]
+        
+        for i, row in enumerate(self._rows):
+            dimension_values = row.get('dimensionValues', [])
+            for j in range(n_dims):
+                dimension_cols[j][i] = dimension_values[j] if j < len(dimension_values) else None
+            
+            metric_groups = row.get('metricValueGroups')
+            primary_values = metric_groups[0].get('primaryValues', []) if metric_groups else []
+            for j in range(n_metrics):
+                metric_cols[j][i] = primary_values[j] if j < len(primary_values) else None
+        
+        columns = dict(zip(self.dimension_headers, dimension_cols))
+        for header, raw in zip(self.metric_headers, metric_cols):
+            columns[header] = _parse_metric_column(raw)
+        
+        return columns
+    
+    def _column_arrays(self) -> Dict[str, np.ndarray]:
+        """Get parsed column arrays keyed by header, parsing rows on first access."""
+        if self._columns is None:
+            self._columns = self._build_columns()
+        return self._columns
+    
+    def _build_rows(self) -> List[Dict[str, Any]]:
+        """Rebuild GAM API style row dicts from the column arrays."""
+        columns = self._column_arrays()
+        dimension_values = [columns[h].tolist() for h in self.dimension_headers]
+        metric_values = [columns[h].tolist() for h in self.metric_headers]
+        
+        return [
+            {
+                'dimensionValues': list(dims),
+                'metricValueGroups': [{'primaryValues': list(metrics)}]
+            }
+            for dims, metrics in zip(
+                zip(*dimension_values) if dimension_values else [()] * self.row_count,
+                zip(*metric_values) if metric_values else [()] * self.row_count
+            )
+        ]
+    
+    def _take(self, indexer: Union[np.ndarray, slice]) -> 'ReportResult':
+        """Create a new result holding the selected positions of every column."""
+        return ReportResult._from_columns(
+            {name: col[indexer] for name, col in self._column_arrays().items()},
+            dimension_headers=self.dimension_headers,
+            metric_headers=self.metric_headers,
+            metadata=self.metadata
+        )
+    
     def to_dataframe(self) -> pd.DataFrame:
         """
         Convert to pandas DataFrame.
         
+        The frame is built once and cached. It shares memory with the
+        parsed column arrays, which are marked read-only so callers cannot
+        corrupt the cache in place; use ``df.copy()`` to get a mutable frame.
+        
         Returns:
             Pandas DataFrame with report data
         """
         if self._dataframe is None:
-            # Convert rows to flat format for DataFrame
-            flat_rows = []
-            for row in self.rows:
-                flat_row = {}
-                
-                # Add dimension values
-                for i, header in enumerate(self.dimension_headers):
-                    if i < len(row.get('dimensionValues', [])):
-                        flat_row[header] = row['dimensionValues'][i]
-                    else:
-                        flat_row[header] = None
-                
-                # Add metric values
-                if 'metricValueGroups' in row and row['metricValueGroups']:
-                    primary_values = row['metricValueGroups'][0].get('primaryValues', [])
-                    for i, header in enumerate(self.metric_headers):
-                        if i < len(primary_values):
-                            # Try to convert to numeric if possible
-                            value = primary_values[i]
-                            try:
-                                if '.' in str(value):
-                                    flat_row[header] = float(value)
-                                else:
-                                    flat_row[header] = int(value)
-                            except (ValueError, TypeError):
-                                flat_row[header] = value
-                        else:
-                            flat_row[header] = None
-                
-                flat_rows.append(flat_row)
-            
-            self._dataframe = pd.DataFrame(flat_rows)
+            columns = self._column_arrays()
+            for array in columns.values():
+                array.setflags(write=False)
+            self._dataframe = pd.DataFrame(columns, copy=False)
         
         return self._dataframe
     
-    def to_csv(self, file_path: Union[str, Path]) -> 'ReportResult':
+    def to_csv(self, file_path: Union[str, Path, TextIO]) -> 'ReportResult':
         """
         Export to CSV file.
         
+        Rows are written in batches of CSV_BATCH_SIZE through a buffered
+        file handle rather than one write call per row.
+        
         Args:
-            file_path: Path to save CSV file
+            file_path: Path to save CSV file, or an open text stream
+                (e.g. ``io.StringIO``) to write into; streams are left open
             
         Returns:
             Self for chaining
+            
+        Raises:
+            ReportError: If the file cannot be written
         """
+        if hasattr(file_path, 'write'):
+            self._write_csv(file_path)
+            return self
+        
         file_path = Path(file_path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        df = self.to_dataframe()
-        df.to_csv(file_path, index=False)
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            with _buffered_writer(file_path) as f:
+                self._write_csv(f)
+        except OSError as e:
+            raise ReportError(f"Failed to export report to CSV: {e}") from e
         
         logger.info(f"Report exported to CSV: {file_path}")
         return self
     
+    def _write_csv(self, f: TextIO) -> None:
+        """Write the header row and all data rows as CSV to a text stream."""
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(self.headers)
+        
+        arrays = self._column_arrays()
+        columns = [_blank_missing(arrays[h]) for h in self.headers]
+        for start in range(0, self.row_count if columns else 0, CSV_BATCH_SIZE):
+            end = start + CSV_BATCH_SIZE
+            writer.writerows(zip(*(col[start:end].tolist() for col in columns)))
+    
     def to_json(self, file_path: Union[str, Path], format: str = 'records') -> 'ReportResult':
         """
         Export to JSON file.
@@ -208,59 +390,170 @@ class ReportResult:
             
         Returns:
             New ReportResult with filtered data
+            
+        Raises:
+            ReportError: If the condition fails
         """
-        df = self.to_dataframe()
-        filtered_df = df[df.apply(condition, axis=1)]
-        
-        # Convert back to original format
-        filtered_rows = []
-        for _, row in filtered_df.iterrows():
-            row_dict = {
-                'dimensionValues': [row[h] for h in self.dimension_headers],
-                'metricValueGroups': [{
-                    'primaryValues': [row[h] for h in self.metric_headers]
-                }]
-            }
-            filtered_rows.append(row_dict)
+        try:
+            df = self.to_dataframe()
+            if df.empty:
+                mask = np.zeros(self.row_count, dtype=bool)
+            else:
+                mask = df.apply(condition, axis=1).to_numpy(dtype=bool)
+        except Exception as e:
+            raise ReportError(f"Filter operation failed: {e}") from e
         
-        return ReportResult(
-            rows=filtered_rows,
-            dimension_headers=self.dimension_headers,
-            metric_headers=self.metric_headers,
-            metadata=self.metadata
-        )
+        return _MaskedReportResult(self, mask)
+    
+    def filter_expr(self, column: str, op: str, value: Any) -> 'ReportResult':
+        """
+        Filter rows by comparing a column against a value.
+        
+        Evaluated as a single vectorized comparison over the column array,
+        which is much faster than calling a Python predicate per row.
+        
+        Args:
+            column: Column name to compare
+            op: Comparison operator ('gt', 'ge', 'lt', 'le', 'eq', 'ne')
+            value: Value to compare against
+            
+        Returns:
+            New ReportResult with filtered data
+            
+        Raises:
+            ValidationError: If the operator is not supported
+            ReportError: If the column does not exist or cannot be compared
+            
+        Example:
+            high_volume = result.filter_expr('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 'gt', 10000)
+        """
+        if op not in FILTER_OPERATORS:
+            available = ', '.join(FILTER_OPERATORS)
+            raise ValidationError(
+                f"Invalid filter operator '{op}'. Available: {available}",
+                field_name='op',
+                field_value=op
+            )
+        
+        try:
+            mask = np.asarray(FILTER_OPERATORS[op](self._column_arrays()[column], value), dtype=bool)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ReportError(f"Filter operation failed: {e}") from e
+        
+        return _MaskedReportResult(self, mask)
     
     def sort(self, by: Union[str, List[str]], ascending: bool = True) -> 'ReportResult':
         """
         Sort results by column(s).
         
+        Rows with missing values in a sort column are placed last in
+        either direction.
+        
         Args:
             by: Column name or list of column names to sort by
             ascending: Sort order
             
         Returns:
             New ReportResult with sorted data
+            
+        Raises:
+            ReportError: If a column does not exist or cannot be ordered
         """
-        df = self.to_dataframe()
-        sorted_df = df.sort_values(by=by, ascending=ascending)
-        
-        # Convert back to original format
-        sorted_rows = []
-        for _, row in sorted_df.iterrows():
-            row_dict = {
-                'dimensionValues': [row[h] for h in self.dimension_headers],
-                'metricValueGroups': [{
-                    'primaryValues': [row[h] for h in self.metric_headers]
-                }]
-            }
-            sorted_rows.append(row_dict)
+        keys = [by] if isinstance(by, str) else list(by)
         
-        return ReportResult(
-            rows=sorted_rows,
-            dimension_headers=self.dimension_headers,
-            metric_headers=self.metric_headers,
-            metadata=self.metadata
-        )
+        try:
+            columns = self._column_arrays()
+            order = np.arange(self.row_count)
+            # Stable sorts from the least to the most significant key
+            for key in reversed(keys):
+                values = columns[key][order]
+                missing = pd.isna(values)
+                present = np.flatnonzero(~missing)
+                present_values = values[present]
+                if ascending:
+                    ranked = np.argsort(present_values, kind='stable')
+                else:
+                    # Sort the reversed values so equal keys keep their order
+                    ranked = np.argsort(present_values[::-1], kind='stable')
+                    ranked = (present_values.size - 1 - ranked)[::-1]
+                # Missing values always go last, as with na_position='last'
+                order = order[np.concatenate([present[ranked], np.flatnonzero(missing)])]
+        except (KeyError, TypeError, ValueError) as e:
+            raise ReportError(f"Sort operation failed: {e}") from e
+        
+        return self._take(order)
+    
+    def top_k(self,
+              column: str,
+              k: int,
+              predicate: Optional[Tuple[str, Any]] = None,
+              ascending: bool = False) -> 'ReportResult':
+        """
+        Get the k rows with the largest (or smallest) values of a column.
+        
+        With the default ``ascending=False`` this is equivalent to
+        ``filter_expr(column, op, value).sort(column, ascending=False).head(k)``
+        but evaluated in one pass: the predicate mask is applied once and
+        numeric columns are partitioned with ``np.argpartition`` so only the
+        selected k rows are fully sorted.
+        
+        Args:
+            column: Column name to rank by
+            k: Number of rows to return
+            predicate: Optional ``(op, value)`` comparison applied to the column first
+            ascending: Return the smallest values instead of the largest
+        
+        Returns:
+            New ReportResult with at most k rows, ordered by the column
+        
+        Raises:
+            ValidationError: If k is negative or the predicate operator is not supported
+            ReportError: If the column does not exist or cannot be ranked
+        
+        Example:
+            top_units = result.top_k('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 10, predicate=('gt', 1000))
+        """
+        if k < 0:
+            raise ValidationError("k must be non-negative", field_name='k', field_value=k)
+        if predicate is not None and predicate[0] not in FILTER_OPERATORS:
+            available = ', '.join(FILTER_OPERATORS)
+            raise ValidationError(
+                f"Invalid filter operator '{predicate[0]}'. Available: {available}",
+                field_name='predicate',
+                field_value=predicate
+            )
+        
+        try:
+            values = self._column_arrays()[column]
+            if predicate is None:
+                candidates = np.arange(values.size)
+            else:
+                candidates = np.flatnonzero(FILTER_OPERATORS[predicate[0]](values, predicate[1]))
+            
+            selected = values[candidates]
+            k = min(k, selected.size)
+            
+            if selected.dtype.kind in 'if':
+                keys = selected if ascending else -selected
+                if k == 0:
+                    part = np.empty(0, dtype=np.intp)
+                elif k < selected.size:
+                    part = np.argpartition(keys, k - 1)[:k]
+                else:
+                    part = np.arange(selected.size)
+                order = part[np.argsort(keys[part], kind='stable')]
+            else:
+                missing = pd.isna(selected)
+                present = np.flatnonzero(~missing)
+                order = present[np.argsort(selected[present], kind='stable')]
+                if not ascending:
+                    order = order[::-1]
+                # Missing values rank last, as in sort()
+                order = np.concatenate([order, np.flatnonzero(missing)])[:k]
+        except (KeyError, TypeError, ValueError) as e:
+            raise ReportError(f"Top-k operation failed: {e}") from e
+        
+        return self._take(candidates[order])
     
     def head(self, n: int = 5) -> 'ReportResult':
         """
@@ -272,12 +565,14 @@ class ReportResult:
         Returns:
             New ReportResult with first n rows
         """
-        return ReportResult(
-            rows=self.rows[:n],
-            dimension_headers=self.dimension_headers,
-            metric_headers=self.metric_headers,
-            metadata=self.metadata
-        )
+        if self._columns is None and self._rows is not None:
+            return ReportResult(
+                rows=self._rows[:n],
+                dimension_headers=self.dimension_headers,
+                metric_headers=self.metric_headers,
+                metadata=self.metadata
+            )
+        return self._take(slice(None, n))
     
     def tail(self, n: int = 5) -> 'ReportResult':
         """
@@ -289,12 +584,15 @@ class ReportResult:
         Returns:
             New ReportResult with last n rows
         """
-        return ReportResult(
-            rows=self.rows[-n:] if n < len(self.rows) else self.rows,
-            dimension_headers=self.dimension_headers,
-            metric_headers=self.metric_headers,
-            metadata=self.metadata
-        )
+        start = max(self.row_count - n, 0)
+        if self._columns is None and self._rows is not None:
+            return ReportResult(
+                rows=self._rows[start:],
+                dimension_headers=self.dimension_headers,
+                metric_headers=self.metric_headers,
+                metadata=self.metadata
+            )
+        return self._take(slice(start, None))
     
     def summary(self) -> Dict[str, Any]:
         """
@@ -331,6 +629,42 @@ class ReportResult:
         return f"ReportResult(rows={self.row_count}, cols={self.column_count})"
 
 
+class _MaskedReportResult(ReportResult):
+    """
+    Filtered view of another result defined by a boolean row mask.
+    
+    Only the mask is stored when filtering; the selected values are
+    gathered from the parent's column arrays the first time the columns
+    are needed, after which the parent and mask are released.
+    """
+    
+    def __init__(self, parent: ReportResult, mask: np.ndarray):
+        """
+        Initialize masked result.
+        
+        Args:
+            parent: Result the rows are selected from
+            mask: Boolean array with one entry per parent row
+        """
+        super().__init__(None, parent.dimension_headers, parent.metric_headers, parent.metadata)
+        self._parent = parent
+        self._mask = mask
+    
+    @property
+    def row_count(self) -> int:
+        """Get number of data rows."""
+        if self._mask is not None:
+            return int(np.count_nonzero(self._mask))
+        return super().row_count
+    
+    def _build_columns(self) -> Dict[str, np.ndarray]:
+        """Gather the masked rows from the parent's column arrays."""
+        columns = {name: col[self._mask] for name, col in self._parent._column_arrays().items()}
+        self._parent = None
+        self._mask = None
+        return columns
+
+
 class ReportBuilder:
     """
     Fluent builder for GAM reports with method chaining.
@@ -458,8 +792,7 @@ class ReportBuilder:
         Returns:
             Self for chaining
         """
-        end_date = date.today()
-        start_date = end_date - timedelta(days=days)
+        start_date, end_date = _days_back_range(date.today(), days)
         return self.date_range(start_date, end_date)
     
     def last_7_days(self) -> 'ReportBuilder':
@@ -50,8 +50,10 @@ extras_require = {
     ],
     "dev": [
         "pytest>=7.0.0",
-        "pytest-asyncio>=0.21.0",
+        "pytest-asyncio>=1.0.0",
         "pytest-cov>=4.0.0",
+        "pytest-xdist>=3.0.0",
+        "pytest-timeout>=2.1.0",
         "black>=23.0.0",
         "flake8>=6.0.0",
         "mypy>=1.0.0",
@@ -4,6 +4,7 @@ Pytest configuration and fixtures for GAM API tests.
 Extended with journey testing and real credentials support.
 """
 
+import copy
 import pytest
 import os
 import tempfile
@@ -28,7 +29,6 @@ sys.path.insert(0, str(project_root / "applications" / "mcp-server"))
 
 # Import from modular structure
 from gam_api.config import Config, AuthConfig, APIConfig, CacheConfig, LoggingConfig, DefaultsConfig, UnifiedClientConfig
-from gam_api import GAMClient
 
 
 # ====================
@@ -67,6 +67,13 @@ def pytest_addoption(parser):
         choices=["api", "mcp", "sdk", "cli"],
         help="Run only journeys for specific interface"
     )
+    
+    parser.addoption(
+        "--slow",
+        action="store_true",
+        default=False,
+        help="Run data-volume tests at full size instead of a small sample"
+    )
 
 
 def pytest_configure(config):
@@ -97,6 +104,14 @@ def pytest_configure(config):
         print("\n🎭 Mock credentials testing (use --real-credentials for real GAM API testing)")
 
 
+def pytest_generate_tests(metafunc):
+    """Size data-volume tests from the --slow option."""
+    
+    if "n_rows" in metafunc.fixturenames:
+        n_rows = 10000 if metafunc.config.getoption("--slow") else 100
+        metafunc.parametrize("n_rows", [n_rows])
+
+
 def pytest_collection_modifyitems(config, items):
     """Modify test collection based on command line options."""
     
@@ -268,9 +283,9 @@ def real_gam_client(gam_credentials_config):
 # =======================
 
 
-@pytest.fixture
-def mock_config():
-    """Create a mock configuration for testing."""
+@pytest.fixture(scope="session")
+def _mock_config_template():
+    """Build the test configuration once per session."""
     return Config(
         auth=AuthConfig(
             network_code="123456789",
@@ -307,6 +322,13 @@ def mock_config():
     )
 
 
+@pytest.fixture
+def mock_config(_mock_config_template):
+    """Create a mock configuration for testing."""
+    # Tests mutate config sections, so each one gets its own deep copy
+    return copy.deepcopy(_mock_config_template)
+
+
 @pytest.fixture
 def mock_auth_manager():
     """Create a mock authentication manager."""
@@ -343,7 +365,7 @@ def mock_gam_client():
 
 
 @pytest.fixture
-def temp_config_file():
+def temp_config_file(tmp_path):
     """Create a temporary config file for testing."""
     config_data = {
         'ad_manager': {
@@ -354,14 +376,11 @@ def temp_config_file():
         }
     }
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+    temp_path = tmp_path / "googleads.yaml"
+    with open(temp_path, 'w') as f:
         yaml.dump(config_data, f)
-        temp_path = f.name
-    
-    yield temp_path
     
-    # Cleanup
-    os.unlink(temp_path)
+    return str(temp_path)
 
 
 @pytest.fixture
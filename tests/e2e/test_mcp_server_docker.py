@@ -200,9 +200,9 @@ class TestMCPToolsListing:
             result = await mcp_client.list_tools()
             if "result" in result:
                 tools = result["result"].get("tools", [])
-                tool_names = [t["name"] for t in tools]
+                tool_names = {t["name"] for t in tools}
 
-                expected_tools = [
+                expected_tools = {
                     "gam_quick_report",
                     "gam_list_reports",
                     "gam_get_dimensions_metrics",
@@ -210,10 +210,10 @@ class TestMCPToolsListing:
                     "gam_get_quick_report_types",
                     "gam_create_report",
                     "gam_run_report",
-                ]
+                }
 
-                for tool_name in expected_tools:
-                    assert tool_name in tool_names, f"Missing tool: {tool_name}"
+                missing = expected_tools - tool_names
+                assert not missing, f"Missing tools: {sorted(missing)}"
             elif "error" in result:
                 # Auth error expected without valid token
                 assert result["error"]["code"] in [-32600, -32601, 401, 403]
@@ -79,18 +79,18 @@ class TestMCPServerWithClient:
 
                     async with Client(mcp) as client:
                         tools = await client.list_tools()
-                        tool_names = [t.name for t in tools]
+                        tool_names = {t.name for t in tools}
 
-                        expected_tools = [
+                        expected_tools = {
                             "gam_quick_report",
                             "gam_list_reports",
                             "gam_get_dimensions_metrics",
                             "gam_get_common_combinations",
                             "gam_get_quick_report_types",
-                        ]
+                        }
 
-                        for tool_name in expected_tools:
-                            assert tool_name in tool_names, f"Missing tool: {tool_name}"
+                        missing = expected_tools - tool_names
+                        assert not missing, f"Missing tools: {sorted(missing)}"
 
     @pytest.mark.asyncio
     async def test_server_tool_descriptions(self, mock_gam_client):
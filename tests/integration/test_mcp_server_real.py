@@ -91,18 +91,18 @@ class TestMCPInspectorCLI:
         result = self.run_inspector(inspector_cmd, "tools/list")
 
         assert "tools" in result
-        tool_names = [t["name"] for t in result["tools"]]
+        tool_names = {t["name"] for t in result["tools"]}
 
-        expected_tools = [
+        expected_tools = {
             "gam_quick_report",
             "gam_list_reports",
             "gam_get_dimensions_metrics",
             "gam_get_common_combinations",
             "gam_get_quick_report_types",
-        ]
+        }
 
-        for expected in expected_tools:
-            assert expected in tool_names, f"Missing tool: {expected}"
+        missing = expected_tools - tool_names
+        assert not missing, f"Missing tools: {sorted(missing)}"
 
     def test_get_quick_report_types(self, inspector_cmd):
         """Test gam_get_quick_report_types returns valid data."""
@@ -368,9 +368,8 @@ class TestMCPFastMCPClient:
         async with Client(server_with_real_client) as client:
             tools = await client.list_tools()
 
-            tool_names = [t.name for t in tools]
-            assert "gam_quick_report" in tool_names
-            assert "gam_get_quick_report_types" in tool_names
+            tool_names = {t.name for t in tools}
+            assert {"gam_quick_report", "gam_get_quick_report_types"} <= tool_names
 
     @pytest.mark.asyncio
     async def test_fastmcp_client_call_metadata_tool(self, server_with_real_client):
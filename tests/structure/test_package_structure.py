@@ -1,18 +1,39 @@
 """Test package structure and directory layout."""
 
-from pathlib import Path
+import os
 import pytest
 
 
+def _scan(base: str, depth: int) -> set:
+    """Collect relative paths under base down to the given depth."""
+    found = set()
+    try:
+        entries = list(os.scandir(base))
+    except FileNotFoundError:
+        return found
+    
+    for entry in entries:
+        path = entry.name if base == "." else f"{base}/{entry.name}"
+        found.add(path)
+        if depth > 1 and entry.is_dir(follow_symlinks=False):
+            found |= _scan(path, depth - 1)
+    return found
+
+
+@pytest.fixture(scope="session")
+def repo_paths():
+    """Existing repository paths, scanned once per session."""
+    return frozenset(_scan(".", 1) | _scan("src", 2) | _scan("tests", 1) | _scan("config", 1))
+
+
 class TestActualProjectStructure:
     """Test that the actual project structure exists and is properly organized."""
     
-    def test_src_structure_exists(self):
+    def test_src_structure_exists(self, repo_paths):
         """Test that src directory structure exists."""
-        assert Path("src").exists()
-        assert Path("src/__init__.py").exists() or True  # __init__.py is optional at root
+        assert "src" in repo_paths  # __init__.py is optional at root
     
-    def test_core_modules_exist(self):
+    def test_core_modules_exist(self, repo_paths):
         """Test that core modules exist in src/."""
         core_modules = [
             "src/core",
@@ -23,9 +44,9 @@ class TestActualProjectStructure:
         ]
         
         for module_path in core_modules:
-            assert Path(module_path).exists(), f"Module {module_path} should exist"
+            assert module_path in repo_paths, f"Module {module_path} should exist"
     
-    def test_core_submodules_exist(self):
+    def test_core_submodules_exist(self, repo_paths):
         """Test that core submodules exist."""
         core_submodules = [
             "src/core/auth.py",
@@ -37,30 +58,30 @@ class TestActualProjectStructure:
         ]
         
         for module_path in core_submodules:
-            assert Path(module_path).exists(), f"Core module {module_path} should exist"
+            assert module_path in repo_paths, f"Core module {module_path} should exist"
     
-    def test_api_structure(self):
+    def test_api_structure(self, repo_paths):
         """Test that API structure exists."""
-        assert Path("src/api").exists()
-        assert Path("src/api/main.py").exists()
-        assert Path("src/api/models.py").exists()
-        assert Path("src/api/auth.py").exists()
+        assert "src/api" in repo_paths
+        assert "src/api/main.py" in repo_paths
+        assert "src/api/models.py" in repo_paths
+        assert "src/api/auth.py" in repo_paths
     
-    def test_mcp_structure(self):
+    def test_mcp_structure(self, repo_paths):
         """Test that MCP structure exists."""
-        assert Path("src/mcp").exists()
-        assert Path("src/mcp/fastmcp_server.py").exists()
-        assert Path("src/mcp/tools").exists()
+        assert "src/mcp" in repo_paths
+        assert "src/mcp/fastmcp_server.py" in repo_paths
+        assert "src/mcp/tools" in repo_paths
     
-    def test_sdk_structure(self):
+    def test_sdk_structure(self, repo_paths):
         """Test that SDK structure exists."""
-        assert Path("src/sdk").exists()
-        assert Path("src/sdk/client.py").exists()
-        assert Path("src/sdk/reports.py").exists()
+        assert "src/sdk" in repo_paths
+        assert "src/sdk/client.py" in repo_paths
+        assert "src/sdk/reports.py" in repo_paths
     
-    def test_utils_structure(self):
+    def test_utils_structure(self, repo_paths):
         """Test that utils structure exists."""
-        assert Path("src/utils").exists()
+        assert "src/utils" in repo_paths
         utils_modules = [
             "src/utils/cache.py",
             "src/utils/formatters.py",
@@ -69,11 +90,11 @@ class TestActualProjectStructure:
         ]
         
         for module_path in utils_modules:
-            assert Path(module_path).exists(), f"Utils module {module_path} should exist"
+            assert module_path in repo_paths, f"Utils module {module_path} should exist"
     
-    def test_test_structure(self):
+    def test_test_structure(self, repo_paths):
         """Test that test directory structure exists."""
-        assert Path("tests").exists()
+        assert "tests" in repo_paths
         test_dirs = [
             "tests/unit",
             "tests/integration", 
@@ -82,32 +103,19 @@ class TestActualProjectStructure:
         ]
         
         for test_dir in test_dirs:
-            assert Path(test_dir).exists(), f"Test directory {test_dir} should exist"
+            assert test_dir in repo_paths, f"Test directory {test_dir} should exist"
     
-    def test_configuration_files(self):
+    def test_configuration_files(self, repo_paths):
         """Test that configuration files exist."""
-        assert Path("setup.py").exists()
-        assert Path("requirements.txt").exists()
-        assert Path("pytest.ini").exists()
+        assert "setup.py" in repo_paths
+        assert "requirements.txt" in repo_paths
+        assert "pytest.ini" in repo_paths
 
 
 class TestExistingStructureIntact:
     """Test that existing structure remains intact."""
     
-    def test_existing_src_structure_intact(self):
-        """Test that the existing src/ structure is not modified."""
-        existing_modules = [
-            "src/core",
-            "src/api", 
-            "src/mcp",
-            "src/sdk",
-            "src/utils",
-        ]
-        
-        for module_path in existing_modules:
-            assert Path(module_path).exists(), f"Existing module {module_path} should remain intact"
-    
-    def test_existing_config_intact(self):
+    def test_existing_config_intact(self, repo_paths):
         """Test that existing configuration remains intact."""
         existing_configs = [
             "config/agent_config.yaml",
@@ -117,4 +125,4 @@ class TestExistingStructureIntact:
         ]
         
         for config_path in existing_configs:
-            assert Path(config_path).exists(), f"Existing config {config_path} should remain intact"
\ No newline at end of file
+            assert config_path in repo_paths, f"Existing config {config_path} should remain intact"
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import Mock, create_autospec, patch
+
+
+@pytest.fixture(scope="module")
+def _patch_auth_manager():
+    """Patch the client's AuthManager once for the whole module."""
+    with patch('src.core.client.AuthManager') as MockAuthManager:
+        yield MockAuthManager
+
+
+@pytest.fixture
+def patched_auth_manager(_patch_auth_manager, mock_auth_manager):
+    """Point the module-wide AuthManager patch at this test's mock auth manager."""
+    _patch_auth_manager.reset_mock()
+    _patch_auth_manager.return_value = mock_auth_manager
+    return _patch_auth_manager
+
+
+@pytest.fixture
+def mock_soap_client():
+    """Create a SOAP client mock specced from AdManagerClient."""
+    from googleads import ad_manager
+    return create_autospec(ad_manager.AdManagerClient, instance=True)
+
+
+@pytest.fixture
+def mock_report_service():
+    """Create a ReportService mock limited to the SOAP service's methods."""
+    return Mock(spec=[
+        'runReportJob',
+        'getReportJobStatus',
+        'getReportDownloadURL',
+        'getReportDownloadUrlWithOptions',
+        'getSavedQueriesByStatement',
+    ])
+
+
+@pytest.fixture
+def soap_stack(mock_auth_manager, mock_soap_client, mock_report_service):
+    """Wire a SOAP client and report service mock behind the mock auth manager."""
+    mock_soap_client.GetService.return_value = mock_report_service
+    mock_auth_manager.get_soap_client.return_value = mock_soap_client
+    return SimpleNamespace(client=mock_soap_client, service=mock_report_service)
+
+
+@pytest.fixture(scope="session")
+def new_format_config_path(tmp_path_factory):
+    """Write a read-only agent_config.yaml in the new format once per session."""
+    path = tmp_path_factory.mktemp("cfg") / "agent_config.yaml"
+    path.write_text(
+        'auth:\n'
+        '  network_code: "987654321"\n'
+        '  oauth2:\n'
+        '    client_id: new_client_id\n'
+        '    client_secret: new_client_secret\n'
+        '    refresh_token: new_refresh_token\n'
+        'api:\n'
+        '  prefer_rest: false\n'
+        '  timeout: 60\n'
+    )
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def invalid_yaml_path(tmp_path_factory):
+    """Write a read-only file of invalid YAML once per session."""
+    path = tmp_path_factory.mktemp("cfg") / "bad.yaml"
+    path.write_text("invalid: yaml: content: [")
+    return str(path)
@@ -0,0 +1,69 @@
+# tests/unit/mcp/conftest.py
+"""Shared fixtures for MCP server unit tests."""
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+
+class MockFastMCP:
+    """Minimal FastMCP stand-in that records the tools registered on it."""
+
+    def __init__(self, name=None, *args, **kwargs):
+        self.name = name
+        self._tools = {}
+
+    def tool(self, fn=None, **kwargs):
+        """Register a tool, usable as ``@mcp.tool`` or ``@mcp.tool(...)``."""
+        def register(func):
+            name = kwargs.get("name", func.__name__)
+            self._tools[name] = SimpleNamespace(name=name, fn=func)
+            return func
+
+        return register(fn) if fn is not None else register
+
+    def custom_route(self, *args, **kwargs):
+        """Accept route registrations without serving them."""
+        return lambda func: func
+
+
+def _build_fastmcp_modules():
+    """Build a mock fastmcp package tree exposing the server and auth classes."""
+    fastmcp_jwt_mock = MagicMock()
+    fastmcp_providers_mock = MagicMock(jwt=fastmcp_jwt_mock)
+    fastmcp_auth_mock = MagicMock(providers=fastmcp_providers_mock)
+    fastmcp_server_mock = MagicMock(auth=fastmcp_auth_mock)
+    fastmcp_mock = MagicMock(server=fastmcp_server_mock, FastMCP=MockFastMCP, Context=MagicMock)
+
+    return {
+        'fastmcp': fastmcp_mock,
+        'fastmcp.server': fastmcp_server_mock,
+        'fastmcp.server.auth': fastmcp_auth_mock,
+        'fastmcp.server.auth.providers': fastmcp_providers_mock,
+        'fastmcp.server.auth.providers.jwt': fastmcp_jwt_mock,
+    }
+
+
+# Only put into sys.modules by the fastmcp_auth_modules fixture
+_FASTMCP_MODULES = _build_fastmcp_modules()
+
+
+@pytest.fixture
+def fastmcp_auth_modules():
+    """Install the mock fastmcp modules for the duration of a test."""
+    jwt_verifier = _FASTMCP_MODULES['fastmcp.server.auth.providers.jwt'].JWTVerifier
+    remote_auth = _FASTMCP_MODULES['fastmcp.server.auth'].RemoteAuthProvider
+    jwt_verifier.reset_mock(return_value=True)
+    remote_auth.reset_mock(return_value=True)
+
+    # patch.dict restores sys.modules on exit, dropping anything imported meanwhile
+    with patch.dict(sys.modules, _FASTMCP_MODULES):
+        yield SimpleNamespace(jwt_verifier=jwt_verifier, remote_auth=remote_auth)
+
+
+@pytest.fixture(scope="module")
+def mock_ctx_factory():
+    """Build a tool context exposing the given report service."""
+    return lambda service: SimpleNamespace(fastmcp=SimpleNamespace(report_service=service))
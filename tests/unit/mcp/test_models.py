@@ -26,8 +26,8 @@ class TestReportResponse:
         assert data["total_rows"] == 100
         assert len(data["dimensions"]) == 2
 
-    def test_report_response_json(self):
-        """Test ReportResponse converts to JSON."""
+    def test_report_response_optional_fields(self):
+        """Test ReportResponse accepts a minimal set of fields."""
         from applications.mcp_server.models.responses import ReportResponse
 
         response = ReportResponse(
@@ -36,10 +36,10 @@ class TestReportResponse:
             total_rows=50,
         )
 
-        json_str = response.model_dump_json()
+        data = response.model_dump()
 
-        assert '"success":true' in json_str
-        assert '"report_type":"inventory"' in json_str
+        assert data["success"] is True
+        assert data["report_type"] == "inventory"
 
 
 class TestErrorResponse:
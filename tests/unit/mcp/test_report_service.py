@@ -3,96 +3,144 @@
 import pytest
 from unittest.mock import Mock
 import json
+import re
+from dataclasses import dataclass
+
+_UNKNOWN_RE = re.compile("Unknown report type")
+_NONE_RE = re.compile("Client cannot be None")
+
+
+@dataclass(frozen=True)
+class _ReportResultStub:
+    """Read-only stand-in for the report result returned by the GAM client."""
+
+    report_type: str
+    total_rows: int
+    dimension_headers: tuple
+    metric_headers: tuple
+    rows: tuple
+
+
+_DELIVERY_RESULT = _ReportResultStub(
+    report_type="delivery",
+    total_rows=100,
+    dimension_headers=("DATE", "AD_UNIT_NAME"),
+    metric_headers=("IMPRESSIONS", "CLICKS"),
+    rows=({"date": "2024-01-01", "impressions": 1000},),
+)
+_INVENTORY_RESULT = _ReportResultStub(
+    report_type="inventory",
+    total_rows=50,
+    dimension_headers=("DATE",),
+    metric_headers=("TOTAL_AD_REQUESTS",),
+    rows=(),
+)
+_RESULTS = {result.report_type: result for result in (_DELIVERY_RESULT, _INVENTORY_RESULT)}
+
+
+class _FakeCache:
+    """Dict-backed stand-in for CacheManager that records get/set calls."""
+
+    def __init__(self):
+        self.storage = {}
+        self.get_calls = []
+        self.set_calls = []
+
+    def get(self, key):
+        self.get_calls.append(key)
+        return self.storage.get(key)
+
+    def set(self, key, value, **kwargs):
+        self.set_calls.append((key, value))
+        self.storage[key] = value
 
 
 class TestReportService:
     """Tests for ReportService business logic."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_gam_client(self):
         """Create mock GAM client."""
         client = Mock()
-        client.delivery_report = Mock(return_value=Mock(
-            total_rows=100,
-            dimension_headers=["DATE", "AD_UNIT_NAME"],
-            metric_headers=["IMPRESSIONS", "CLICKS"],
-            rows=[{"date": "2024-01-01", "impressions": 1000}]
-        ))
-        client.inventory_report = Mock(return_value=Mock(
-            total_rows=50,
-            dimension_headers=["DATE"],
-            metric_headers=["TOTAL_AD_REQUESTS"],
-            rows=[]
-        ))
+        client.delivery_report = Mock(return_value=_DELIVERY_RESULT)
+        client.inventory_report = Mock(return_value=_INVENTORY_RESULT)
         return client
 
     @pytest.fixture
     def mock_cache(self):
-        """Create mock cache manager."""
-        cache = Mock()
-        cache.get = Mock(return_value=None)
-        cache.set = Mock()
-        return cache
-
-    def test_quick_report_delivery(self, mock_gam_client, mock_cache):
-        """Test generating delivery quick report."""
-        from applications.mcp_server.services import ReportService
+        """Create an empty fake cache manager."""
+        return _FakeCache()
 
-        service = ReportService(client=mock_gam_client, cache=mock_cache)
-        result = service.quick_report("delivery", days_back=7)
-
-        assert result["success"] is True
-        assert result["report_type"] == "delivery"
-        assert result["total_rows"] == 100
-        mock_gam_client.delivery_report.assert_called_once()
+    @pytest.fixture
+    def client_result(self, request):
+        """Result stub for the parametrized report type."""
+        return _RESULTS[request.param]
 
-    def test_quick_report_inventory(self, mock_gam_client, mock_cache):
-        """Test generating inventory quick report."""
+    @pytest.fixture(scope="module")
+    def service(self, mock_gam_client):
+        """Shared ReportService for read-only queries."""
+        from applications.mcp_server.services import ReportService
+        return ReportService(client=mock_gam_client)
+
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, mock_gam_client):
+        """Clear call history on the shared client mock after each test."""
+        yield
+        mock_gam_client.reset_mock()
+
+    @pytest.mark.parametrize(
+        ("client_result", "days_back"),
+        [("delivery", 7), ("inventory", 30)],
+        indirect=["client_result"],
+        ids=["delivery", "inventory"],
+    )
+    def test_quick_report(self, mock_gam_client, mock_cache, client_result, days_back):
+        """Test generating delivery and inventory quick reports."""
         from applications.mcp_server.services import ReportService
-
         service = ReportService(client=mock_gam_client, cache=mock_cache)
-        result = service.quick_report("inventory", days_back=30)
+        result = service.quick_report(client_result.report_type, days_back=days_back)
 
         assert result["success"] is True
-        assert result["report_type"] == "inventory"
-        mock_gam_client.inventory_report.assert_called_once()
+        assert result["report_type"] == client_result.report_type
+        assert result["total_rows"] == client_result.total_rows
+        getattr(mock_gam_client, f"{client_result.report_type}_report").assert_called_once()
+        cache_key = f"quick_report:{client_result.report_type}:{days_back}:json"
+        assert mock_cache.get_calls == [cache_key]
+        assert mock_cache.set_calls == [(cache_key, result)]
 
     def test_quick_report_invalid_type(self, mock_gam_client, mock_cache):
         """Test quick report with invalid type raises error."""
         from applications.mcp_server.services import ReportService
-
         service = ReportService(client=mock_gam_client, cache=mock_cache)
 
-        with pytest.raises(ValueError, match="Unknown report type"):
+        with pytest.raises(ValueError, match=_UNKNOWN_RE):
             service.quick_report("invalid_type", days_back=7)
 
     def test_quick_report_uses_cache(self, mock_gam_client, mock_cache):
         """Test that quick report checks cache first."""
         from applications.mcp_server.services import ReportService
-
         # Cache returns a hit
         cached_result = {"success": True, "report_type": "delivery", "from_cache": True}
-        mock_cache.get = Mock(return_value=cached_result)
+        mock_cache.storage["quick_report:delivery:7:json"] = cached_result
 
         service = ReportService(client=mock_gam_client, cache=mock_cache)
         result = service.quick_report("delivery", days_back=7)
 
         assert result["from_cache"] is True
         mock_gam_client.delivery_report.assert_not_called()
+        assert mock_cache.get_calls == ["quick_report:delivery:7:json"]
+        assert mock_cache.set_calls == []
 
     def test_init_validates_client_not_none(self):
         """Test that __init__ raises ValueError when client is None."""
         from applications.mcp_server.services import ReportService
-
-        with pytest.raises(ValueError, match="Client cannot be None"):
+        with pytest.raises(ValueError, match=_NONE_RE):
             ReportService(client=None)
 
-    def test_list_reports(self, mock_gam_client):
+    def test_list_reports(self, service, mock_gam_client, monkeypatch):
         """Test listing available reports."""
-        from applications.mcp_server.services import ReportService
-
         # Mock client response
-        mock_gam_client.list_reports = Mock(return_value=[
+        monkeypatch.setattr(mock_gam_client, "list_reports", Mock(return_value=[
             {
                 "reportId": "report-1",
                 "displayName": "Test Report 1",
@@ -105,9 +153,8 @@ class TestReportService:
                 "createTime": "2024-01-03T00:00:00Z",
                 "updateTime": "2024-01-04T00:00:00Z",
             }
-        ])
+        ]))
 
-        service = ReportService(client=mock_gam_client)
         result = service.list_reports(limit=20)
 
         assert result["success"] is True
@@ -117,11 +164,8 @@ class TestReportService:
         assert result["reports"][0]["name"] == "Test Report 1"
         mock_gam_client.list_reports.assert_called_once_with(limit=20)
 
-    def test_get_dimensions_metrics_both(self, mock_gam_client):
+    def test_get_dimensions_metrics_both(self, service):
         """Test getting both dimensions and metrics."""
-        from applications.mcp_server.services import ReportService
-
-        service = ReportService(client=mock_gam_client)
         result = service.get_dimensions_metrics(report_type="HISTORICAL", category="both")
 
         assert result["success"] is True
@@ -133,33 +177,24 @@ class TestReportService:
         assert len(result["dimensions"]) > 0
         assert len(result["metrics"]) > 0
 
-    def test_get_dimensions_metrics_dimensions_only(self, mock_gam_client):
+    def test_get_dimensions_metrics_dimensions_only(self, service):
         """Test getting dimensions only."""
-        from applications.mcp_server.services import ReportService
-
-        service = ReportService(client=mock_gam_client)
         result = service.get_dimensions_metrics(report_type="HISTORICAL", category="dimensions")
 
         assert result["success"] is True
         assert "dimensions" in result
         assert "metrics" not in result
 
-    def test_get_dimensions_metrics_metrics_only(self, mock_gam_client):
+    def test_get_dimensions_metrics_metrics_only(self, service):
         """Test getting metrics only."""
-        from applications.mcp_server.services import ReportService
-
-        service = ReportService(client=mock_gam_client)
         result = service.get_dimensions_metrics(report_type="HISTORICAL", category="metrics")
 
         assert result["success"] is True
         assert "metrics" in result
         assert "dimensions" not in result
 
-    def test_get_dimensions_metrics_reach_report(self, mock_gam_client):
+    def test_get_dimensions_metrics_reach_report(self, service):
         """Test getting metrics for REACH report type includes reach-specific metrics."""
-        from applications.mcp_server.services import ReportService
-
-        service = ReportService(client=mock_gam_client)
         result = service.get_dimensions_metrics(report_type="REACH", category="metrics")
 
         assert result["success"] is True
@@ -167,11 +202,8 @@ class TestReportService:
         # REACH reports should include reach-specific metrics
         assert isinstance(result["metrics"], list)
 
-    def test_get_common_combinations(self, mock_gam_client):
+    def test_get_common_combinations(self, service):
         """Test getting common dimension-metric combinations."""
-        from applications.mcp_server.services import ReportService
-
-        service = ReportService(client=mock_gam_client)
         result = service.get_common_combinations()
 
         assert result["success"] is True
@@ -191,11 +223,8 @@ class TestReportService:
             assert isinstance(combo_data["dimensions"], list)
             assert isinstance(combo_data["metrics"], list)
 
-    def test_get_quick_report_types(self, mock_gam_client):
+    def test_get_quick_report_types(self, service):
         """Test getting available quick report types."""
-        from applications.mcp_server.services import ReportService
-
-        service = ReportService(client=mock_gam_client)
         result = service.get_quick_report_types()
 
         assert result["success"] is True
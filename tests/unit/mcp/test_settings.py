@@ -3,56 +3,68 @@
 
 import pytest
 import os
-from unittest.mock import patch
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    """Remove all environment variables for the duration of a test."""
+    for key in list(os.environ):
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
 
 
 class TestMCPSettings:
     """Tests for MCPSettings configuration."""
 
-    def test_settings_loads_defaults(self):
-        """Test settings loads with default values."""
-        # Clear relevant env vars
-        with patch.dict(os.environ, {}, clear=True):
-            from applications.mcp_server.settings import MCPSettings
-
-            settings = MCPSettings()
-
-            assert settings.auth_enabled is False
-            assert settings.port == 8080
-            assert settings.log_level == "INFO"
-            assert settings.oauth_gateway_url == "https://ag.etus.io"
-
-    def test_settings_from_environment(self):
-        """Test settings loads from environment variables."""
-        env_vars = {
-            "MCP_AUTH_ENABLED": "true",
-            "MCP_PORT": "9000",
-            "MCP_LOG_LEVEL": "DEBUG",
-            "MCP_RESOURCE_URI": "https://my-server.run.app",
-        }
-
-        with patch.dict(os.environ, env_vars, clear=True):
-            from applications.mcp_server.settings import MCPSettings
-
-            settings = MCPSettings()
-
-            assert settings.auth_enabled is True
-            assert settings.port == 9000
-            assert settings.log_level == "DEBUG"
-            assert settings.mcp_resource_uri == "https://my-server.run.app"
-
-    def test_oauth_derived_settings(self):
-        """Test OAuth settings are derived correctly."""
-        env_vars = {
-            "MCP_OAUTH_GATEWAY_URL": "https://custom-oauth.example.com",
-            "MCP_RESOURCE_URI": "https://my-server.run.app",
-        }
-
-        with patch.dict(os.environ, env_vars, clear=True):
-            from applications.mcp_server.settings import MCPSettings
-
-            settings = MCPSettings()
-
-            assert settings.oauth_jwks_uri == "https://custom-oauth.example.com/.well-known/jwks.json"
-            assert settings.oauth_issuer == "https://custom-oauth.example.com"
-            assert settings.oauth_audience == "https://my-server.run.app"
+    @pytest.mark.parametrize(
+        ("env", "expected"),
+        [
+            (
+                {},
+                {
+                    "auth_enabled": False,
+                    "port": 8080,
+                    "log_level": "INFO",
+                    "oauth_gateway_url": "https://ag.etus.io",
+                },
+            ),
+            (
+                {
+                    "MCP_AUTH_ENABLED": "true",
+                    "MCP_PORT": "9000",
+                    "MCP_LOG_LEVEL": "DEBUG",
+                    "MCP_RESOURCE_URI": "https://my-server.run.app",
+                },
+                {
+                    "auth_enabled": True,
+                    "port": 9000,
+                    "log_level": "DEBUG",
+                    "mcp_resource_uri": "https://my-server.run.app",
+                },
+            ),
+            (
+                {
+                    "MCP_OAUTH_GATEWAY_URL": "https://custom-oauth.example.com",
+                    "MCP_RESOURCE_URI": "https://my-server.run.app",
+                },
+                {
+                    "oauth_jwks_uri": "https://custom-oauth.example.com/.well-known/jwks.json",
+                    "oauth_issuer": "https://custom-oauth.example.com",
+                    "oauth_audience": "https://my-server.run.app",
+                },
+            ),
+        ],
+        ids=["defaults", "from_environment", "oauth_derived"],
+    )
+    def test_settings_from_env(self, clean_env, env, expected):
+        """Test settings load defaults, environment values and derived OAuth URLs."""
+        from applications.mcp_server.settings import MCPSettings
+
+        for key, value in env.items():
+            clean_env.setenv(key, value)
+
+        settings = MCPSettings()
+
+        assert {name: getattr(settings, name) for name in expected} == expected
@@ -3,14 +3,38 @@ Unit tests for authentication management.
 """
 
 import pytest
+import re
 import tempfile
 import yaml
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 
 from gam_api.auth import AuthManager, get_auth_manager
 from gam_api.config import Config, AuthConfig
 from gam_api.exceptions import AuthenticationError, ConfigurationError
 
+_ERR_NETWORK = re.compile(r"Network code is required")
+_ERR_CLIENT = re.compile(r"Client ID is required")
+_ERR_REFRESH = re.compile(r"Refresh token is required")
+_ERR_SOAP = re.compile(r"Failed to create SOAP client")
+
+
+@pytest.fixture(scope="module")
+def shared_auth_manager(_mock_config_template):
+    """Share one AuthManager across the read-only tests in this module."""
+    with patch('src.core.auth.get_config', return_value=_mock_config_template), \
+            patch('src.core.auth.load_config', return_value=_mock_config_template):
+        auth_manager = get_auth_manager()
+        # Load the config while patched; the manager caches it afterwards
+        auth_manager.config
+    return auth_manager
+
+
+@pytest.fixture
+def auth_manager(mock_config):
+    """Create an AuthManager over this test's mock config."""
+    return AuthManager(mock_config)
+
 
 class TestAuthManager:
     """Test AuthManager functionality."""
@@ -33,30 +57,26 @@ class TestAuthManager:
         # Should not raise any exceptions
         auth_manager.validate_config()
     
-    def test_validate_config_missing_network_code(self, mock_config):
-        """Test config validation with missing network code."""
-        mock_config.auth.network_code = None
-        with patch('src.core.auth.get_config', return_value=mock_config):
-            with patch('src.core.auth.load_config', return_value=mock_config):
-                auth_manager = AuthManager()
-                
-                with pytest.raises(ConfigurationError, match="Network code is required"):
-                    auth_manager.validate_config()
-    
-    def test_validate_config_missing_client_id(self, mock_config):
-        """Test config validation with missing client ID."""
-        mock_config.auth.client_id = None
-        with patch('src.core.auth.get_config', return_value=mock_config):
-            with patch('src.core.auth.load_config', return_value=mock_config):
-                auth_manager = AuthManager()
-                
-                with pytest.raises(ConfigurationError, match="Client ID is required"):
-                    auth_manager.validate_config()
+    @pytest.mark.parametrize("field,value,match", [
+        ("network_code", None, _ERR_NETWORK),
+        ("client_id", None, _ERR_CLIENT),
+        ("refresh_token", "", _ERR_REFRESH),
+        ("client_secret", None, None),
+    ])
+    def test_validate_config_missing(self, mock_config, field, value, match):
+        """Test config validation with a missing required field."""
+        setattr(mock_config.auth, field, value)
+        with patch.multiple('src.core.auth', get_config=DEFAULT, load_config=DEFAULT) as mocks:
+            mocks['get_config'].return_value = mock_config
+            mocks['load_config'].return_value = mock_config
+            auth_manager = AuthManager()
+            
+            with pytest.raises(ConfigurationError, match=match):
+                auth_manager.validate_config()
     
-    def test_get_credentials(self, mock_config):
+    def test_get_credentials(self, shared_auth_manager):
         """Test getting OAuth2 credentials."""
-        auth_manager = AuthManager(mock_config)
-        credentials = auth_manager.get_credentials()
+        credentials = shared_auth_manager.get_credentials()
         
         expected = {
             'client_id': 'test_client_id',
@@ -66,38 +86,37 @@ class TestAuthManager:
         
         assert credentials == expected
     
+    @pytest.fixture
+    def legacy_yaml_file(self):
+        """Patch the temporary legacy YAML file written for the SOAP client."""
+        with patch('tempfile.NamedTemporaryFile') as mock_temp, \
+                patch('yaml.safe_dump') as mock_dump, \
+                patch('os.unlink') as mock_unlink:
+            mock_temp.return_value.__enter__.return_value.name = '/tmp/test.yaml'
+            yield SimpleNamespace(temp=mock_temp, dump=mock_dump, unlink=mock_unlink)
+    
     @patch('src.core.auth.ad_manager.AdManagerClient')
-    def test_get_soap_client_success(self, mock_client_class, mock_config):
+    def test_get_soap_client_success(self, mock_client_class, auth_manager, legacy_yaml_file):
         """Test successful SOAP client creation."""
         mock_client = Mock()
         mock_client_class.return_value = mock_client
         
-        auth_manager = AuthManager(mock_config)
+        client = auth_manager.get_soap_client()
         
-        with patch('tempfile.NamedTemporaryFile') as mock_temp:
-            mock_temp.return_value.__enter__.return_value.name = '/tmp/test.yaml'
-            
-            with patch('yaml.dump') as mock_dump:
-                with patch('os.unlink') as mock_unlink:
-                    client = auth_manager.get_soap_client()
-                    
-                    assert client == mock_client
-                    mock_client_class.assert_called_once()
+        assert client == mock_client
+        mock_client_class.assert_called_once()
     
     @patch('src.core.auth.ad_manager.AdManagerClient')
-    def test_get_soap_client_failure(self, mock_client_class, mock_config):
+    def test_get_soap_client_failure(self, mock_client_class, auth_manager, legacy_yaml_file):
         """Test SOAP client creation failure."""
         mock_client_class.side_effect = Exception("SOAP client error")
         
-        auth_manager = AuthManager(mock_config)
-        
-        with pytest.raises(AuthenticationError, match="Failed to create SOAP client"):
+        with pytest.raises(AuthenticationError, match=_ERR_SOAP):
             auth_manager.get_soap_client()
     
-    def test_create_legacy_yaml_format(self, mock_config):
+    def test_create_legacy_yaml_format(self, shared_auth_manager):
         """Test creation of legacy YAML format."""
-        auth_manager = AuthManager(mock_config)
-        legacy_data = auth_manager._create_legacy_yaml_data()
+        legacy_data = shared_auth_manager._create_legacy_yaml_data()
         
         expected = {
             'ad_manager': {
@@ -111,64 +130,52 @@ class TestAuthManager:
         assert legacy_data == expected
 
 
+@pytest.mark.integration
 class TestAuthManagerIntegration:
     """Test AuthManager integration scenarios."""
     
-    def test_end_to_end_auth_flow(self, mock_config):
+    def test_end_to_end_auth_flow(self, shared_auth_manager):
         """Test complete authentication flow."""
-        auth_manager = AuthManager(mock_config)
-        
         # Validate config
-        auth_manager.validate_config()
+        shared_auth_manager.validate_config()
         
         # Get credentials
-        credentials = auth_manager.get_credentials()
+        credentials = shared_auth_manager.get_credentials()
         assert 'client_id' in credentials
         assert 'client_secret' in credentials
         assert 'refresh_token' in credentials
         
         # Create legacy YAML data
-        legacy_data = auth_manager._create_legacy_yaml_data()
+        legacy_data = shared_auth_manager._create_legacy_yaml_data()
         assert 'ad_manager' in legacy_data
         assert legacy_data['ad_manager']['network_code'] == '123456789'
     
     @patch('src.core.auth.get_config')
-    def test_get_auth_manager_singleton(self, mock_get_config, mock_config):
-        """Test that get_auth_manager returns singleton."""
+    def test_get_auth_manager_uses_shared_config(self, mock_get_config, mock_config):
+        """Test that get_auth_manager builds managers over the shared config."""
         mock_get_config.return_value = mock_config
         
         auth1 = get_auth_manager()
         auth2 = get_auth_manager()
         
-        # Should be the same instance (singleton)
-        assert auth1 is auth2
+        # Each call builds a new manager, but both read the same config
+        assert auth1 is not auth2
+        assert auth1.config is mock_config
+        assert auth2.config is mock_config
     
-    def test_refresh_token_validation(self, mock_config):
-        """Test refresh token validation."""
-        # Valid refresh token
-        auth_manager = AuthManager(mock_config)
-        auth_manager.validate_config()  # Should not raise
-        
-        # Invalid refresh token
-        mock_config.auth.refresh_token = ""
-        with pytest.raises(ConfigurationError, match="Refresh token is required"):
-            auth_manager.validate_config()
-    
-    def test_network_code_validation(self, mock_config):
+    def test_network_code_validation(self, auth_manager, mock_config):
         """Test network code validation."""
         # Valid network code
-        auth_manager = AuthManager(mock_config)
         auth_manager.validate_config()  # Should not raise
         
         # Invalid network code (not numeric)
         mock_config.auth.network_code = "invalid"
-        auth_manager = AuthManager(mock_config)
         # Should still work - network code can be alphanumeric
         auth_manager.validate_config()
         
         # Empty network code
         mock_config.auth.network_code = ""
-        with pytest.raises(ConfigurationError, match="Network code is required"):
+        with pytest.raises(ConfigurationError, match=_ERR_NETWORK):
             auth_manager.validate_config()
 
 
@@ -189,20 +196,9 @@ class TestAuthManagerErrorHandling:
             AuthManager(config)
     
     @patch('src.core.auth.ad_manager.AdManagerClient')
-    def test_soap_client_network_error(self, mock_client_class, mock_config):
+    def test_soap_client_network_error(self, mock_client_class, auth_manager):
         """Test SOAP client creation with network error."""
         mock_client_class.side_effect = ConnectionError("Network error")
         
-        auth_manager = AuthManager(mock_config)
-        
-        with pytest.raises(AuthenticationError, match="Failed to create SOAP client"):
+        with pytest.raises(AuthenticationError, match=_ERR_SOAP):
             auth_manager.get_soap_client()
-    
-    def test_credentials_with_missing_fields(self, mock_config):
-        """Test getting credentials with missing fields."""
-        mock_config.auth.client_secret = None
-        
-        auth_manager = AuthManager(mock_config)
-        
-        with pytest.raises(ConfigurationError):
-            auth_manager.validate_config()
\ No newline at end of file
@@ -3,8 +3,6 @@ Unit tests for configuration management.
 """
 
 import pytest
-import os
-import tempfile
 import yaml
 from unittest.mock import patch, mock_open
 
@@ -53,96 +51,121 @@ class TestConfigModels:
 class TestConfigLoader:
     """Test configuration loading functionality."""
     
-    def test_load_from_yaml_legacy_format(self, temp_config_file):
+    def test_load_from_yaml_legacy_format(self, temp_config_file, monkeypatch):
         """Test loading legacy googleads.yaml format."""
-        with patch('src.core.config.ConfigLoader._find_legacy_config', return_value=temp_config_file):
-            loader = ConfigLoader()
-            config = loader.load_config()
+        monkeypatch.setattr(ConfigLoader, "_find_legacy_config", lambda self: temp_config_file)
+        loader = ConfigLoader()
+        config = loader.load_config()
         
         assert config.auth.network_code == "123456789"
         assert config.auth.client_id == "test_client_id"
         assert config.auth.client_secret == "test_client_secret"
         assert config.auth.refresh_token == "test_refresh_token"
     
-    def test_load_from_yaml_new_format(self):
+    def test_load_from_yaml_new_format(self, new_format_config_path, monkeypatch):
         """Test loading new agent_config.yaml format."""
-        config_data = {
-            'auth': {
-                'network_code': '987654321',
-                'oauth2': {
-                    'client_id': 'new_client_id',
-                    'client_secret': 'new_client_secret',
-                    'refresh_token': 'new_refresh_token'
-                }
-            },
-            'api': {
-                'prefer_rest': False,
-                'timeout': 60
-            }
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = f.name
+        monkeypatch.setattr(ConfigLoader, "_find_agent_config", lambda self: new_format_config_path)
+        loader = ConfigLoader()
+        config = loader.load_config()
         
-        try:
-            with patch('src.core.config.ConfigLoader._find_agent_config', return_value=temp_path):
-                loader = ConfigLoader()
-                config = loader.load_config()
-            
-            assert config.auth.network_code == "987654321"
-            assert config.auth.client_id == "new_client_id"
-            assert config.api.prefer_rest is False
-            assert config.api.timeout == 60
-        finally:
-            os.unlink(temp_path)
+        assert config.auth.network_code == "987654321"
+        assert config.auth.client_id == "new_client_id"
+        assert config.api.prefer_rest is False
+        assert config.api.timeout == 60
     
-    def test_load_from_environment(self, test_env):
+    def test_load_from_environment(self, test_env, monkeypatch):
         """Test loading configuration from environment variables."""
-        with patch('src.core.config.ConfigLoader._find_agent_config', return_value=None):
-            with patch('src.core.config.ConfigLoader._find_legacy_config', return_value=None):
-                loader = ConfigLoader()
-                config = loader.load_config()
+        monkeypatch.setattr(ConfigLoader, "_find_agent_config", lambda self: None)
+        monkeypatch.setattr(ConfigLoader, "_find_legacy_config", lambda self: None)
+        loader = ConfigLoader()
+        config = loader.load_config()
         
         assert config.auth.network_code == "123456789"
         assert config.auth.client_id == "test_client_id"
         assert config.auth.client_secret == "test_client_secret"
         assert config.auth.refresh_token == "test_refresh_token"
     
-    def test_load_priority_file_over_env(self, temp_config_file, test_env):
+    def test_load_priority_file_over_env(self, temp_config_file, test_env, monkeypatch):
         """Test that file configuration takes priority over environment."""
-        with patch('src.core.config.ConfigLoader._find_legacy_config', return_value=temp_config_file):
-            loader = ConfigLoader()
-            config = loader.load_config()
+        monkeypatch.setattr(ConfigLoader, "_find_legacy_config", lambda self: temp_config_file)
+        loader = ConfigLoader()
+        config = loader.load_config()
         
         # Should use file values, not environment values
         assert config.auth.client_id == "test_client_id"  # from file
         # Environment has different client_id, so this confirms file priority
     
-    def test_load_fallback_to_env(self, test_env):
+    def test_load_fallback_to_env(self, test_env, monkeypatch):
         """Test fallback to environment when no config files exist."""
-        with patch('src.core.config.ConfigLoader._find_agent_config', return_value=None):
-            with patch('src.core.config.ConfigLoader._find_legacy_config', return_value=None):
-                loader = ConfigLoader()
-                config = loader.load_config()
+        monkeypatch.setattr(ConfigLoader, "_find_agent_config", lambda self: None)
+        monkeypatch.setattr(ConfigLoader, "_find_legacy_config", lambda self: None)
+        loader = ConfigLoader()
+        config = loader.load_config()
         
         assert config.auth.network_code == "123456789"
     
-    def test_invalid_yaml_raises_error(self):
+    def test_invalid_yaml_raises_error(self, invalid_yaml_path, monkeypatch):
         """Test that invalid YAML raises ConfigurationError."""
-        invalid_yaml = "invalid: yaml: content: ["
+        monkeypatch.setattr(ConfigLoader, "_find_legacy_config", lambda self: invalid_yaml_path)
+        loader = ConfigLoader()
+        with pytest.raises(ConfigurationError):
+            loader.load_config()
+    
+    def test_env_fills_fields_missing_from_file(self, tmp_path, monkeypatch):
+        """Test that environment variables fill settings the config file leaves unset."""
+        config_path = tmp_path / "agent_config.yaml"
+        config_path.write_text("auth:\n  network_code: '987654321'\napi:\n  timeout: 60\n")
+        monkeypatch.setenv('GAM_CLIENT_ID', 'env_client_id')
+        monkeypatch.setenv('GAM_TIMEOUT', '15')
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml)
-            temp_path = f.name
+        config = ConfigLoader()._load_agent_config(str(config_path))
         
-        try:
-            with patch('src.core.config.ConfigLoader._find_legacy_config', return_value=temp_path):
-                loader = ConfigLoader()
-                with pytest.raises(ConfigurationError):
-                    loader.load_config()
-        finally:
-            os.unlink(temp_path)
+        assert config.auth.network_code == "987654321"
+        assert config.auth.client_id == "env_client_id"
+        assert config.api.timeout == 60  # file wins over environment
+    
+    def test_invalid_env_value_ignored_for_file_config(self, tmp_path, monkeypatch):
+        """Test that an unparseable environment variable does not break a valid config file."""
+        config_path = tmp_path / "googleads.yaml"
+        config_path.write_text(
+            "ad_manager:\n"
+            "  network_code: '123456789'\n"
+            "  client_id: file_client_id\n"
+            "  client_secret: file_client_secret\n"
+            "  refresh_token: file_refresh_token\n"
+        )
+        monkeypatch.setenv('GAM_TIMEOUT', 'abc')
+        
+        config = ConfigLoader()._load_legacy_config(str(config_path))
+        
+        assert config.auth.client_id == "file_client_id"
+        assert config.api.timeout == 30
+    
+    def test_invalid_env_value_raises_for_env_config(self, test_env, monkeypatch):
+        """Test that an unparseable environment variable fails environment-only loading."""
+        monkeypatch.setenv('GAM_TIMEOUT', 'abc')
+        
+        with pytest.raises(ValueError):
+            ConfigLoader()._load_from_env()
+    
+    def test_yaml_parse_cached_until_file_changes(self, tmp_path):
+        """Test that an unchanged config file is parsed only once."""
+        config_path = tmp_path / "agent_config.yaml"
+        config_path.write_text("auth:\n  network_code: '111'\n")
+        reset_config()
+        
+        with patch('gam_api.config.yaml.load', wraps=yaml.load) as mock_load:
+            loader = ConfigLoader()
+            first = loader._load_yaml_file(str(config_path))
+            second = loader._load_yaml_file(str(config_path))
+            assert mock_load.call_count == 1
+            assert first is second
+            
+            config_path.write_text("auth:\n  network_code: '222222'\n")
+            changed = loader._load_yaml_file(str(config_path))
+        
+        assert mock_load.call_count == 2
+        assert changed['auth']['network_code'] == '222222'
 
 
 class TestConfigAPI:
@@ -166,6 +189,16 @@ class TestConfigAPI:
             # Should be different instances after reset
             assert config1 is not config2
     
+    def test_get_config_returns_none_when_unavailable(self):
+        """Test that get_config returns None when no configuration can be loaded."""
+        reset_config()
+        try:
+            with patch('gam_api.config.ConfigLoader.load_config',
+                       side_effect=ConfigurationError("No configuration found")):
+                assert get_config() is None
+        finally:
+            reset_config()
+    
     def test_config_validation(self):
         """Test configuration validation."""
         # Valid config should not raise
@@ -6,12 +6,19 @@ across all SDK components.
 """
 
 import pytest
+import io
 import json
 import tempfile
 import os
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Optional
 from unittest.mock import Mock, patch, MagicMock
 from datetime import date, timedelta
+import numpy as np
 import requests
+import yaml
 
 from gam_sdk.client import GAMClient
 from gam_sdk.reports import ReportBuilder, ReportResult
@@ -26,6 +33,73 @@ from gam_api.exceptions import (
 )
 
 
+# ReportGenerator methods the builder calls during execute()
+_GENERATOR_METHODS = ('create_report', 'run_report', 'fetch_results')
+
+# Core AuthManager attributes the SDK client, config and auth modules use
+_AUTH_ATTRS = ('get_oauth2_credentials', 'get_soap_client', 'get_rest_session', '_get_request')
+
+# Single GAM API row shared by the ReportResult error tests
+_SAMPLE_ROWS = (
+    {
+        'dimensionValues': ('2024-01-01', 'Ad Unit 1'),
+        'metricValueGroups': ({'primaryValues': ('1000', '50')},)
+    },
+)
+
+
+@dataclass
+class _CredentialsStub:
+    """Plain stand-in for OAuth2 credentials; only ``refresh`` is a mock."""
+    
+    expired: bool = False
+    expiry: Optional[Any] = None
+    refresh_token: str = 'test_refresh_token'
+    token: str = 'test_access_token'
+    refresh: Mock = field(default_factory=Mock)
+    scopes: list = field(default_factory=lambda: [
+        'https://www.googleapis.com/auth/dfp',
+        'https://www.googleapis.com/auth/admanager'
+    ])
+
+
+@pytest.fixture
+def mock_oauth_credentials():
+    """OAuth2 credentials stub for the auth error tests."""
+    return _CredentialsStub()
+
+
+@contextmanager
+def _patched_client_deps(config):
+    """Patch GAMClient's config loader and core AuthManager, returning ``config``."""
+    with ExitStack() as stack:
+        mock_get_config = stack.enter_context(patch('src.sdk.client.get_config'))
+        mock_auth_manager = stack.enter_context(patch('src.sdk.client.AuthManager'))
+        mock_get_config.return_value = config
+        mock_auth_manager.return_value = Mock(spec_set=_AUTH_ATTRS)
+        yield mock_get_config, mock_auth_manager
+
+
+@pytest.fixture(scope="class")
+def _patched_sdk_client(_mock_config_template):
+    """Patch the client's config and auth dependencies once per test class."""
+    with _patched_client_deps(_mock_config_template) as (mock_get_config, mock_auth_manager):
+        yield SimpleNamespace(
+            get_config=mock_get_config,
+            auth_manager=mock_auth_manager,
+            auth=mock_auth_manager.return_value,
+            client=GAMClient(auto_authenticate=False),
+        )
+
+
+@pytest.fixture
+def patched_sdk_client(_patched_sdk_client):
+    """Class-shared patched client, reset to unauthenticated for this test."""
+    _patched_sdk_client.auth.reset_mock(side_effect=True)
+    _patched_sdk_client.client._authenticated = False
+    return _patched_sdk_client
+
+
 class TestSDKClientErrorScenarios:
     """Test error scenarios in GAMClient."""
     
@@ -37,10 +111,9 @@ class TestSDKClientErrorScenarios:
         with patch('src.sdk.client.get_config') as mock_get_config:
             mock_get_config.side_effect = FileNotFoundError("Config file not found")
             
-            with pytest.raises(ConfigError) as exc_info:
+            with pytest.raises(ConfigError, match="Failed to load configuration") as exc_info:
                 GAMClient()
             
-            assert "Failed to load configuration" in str(exc_info.value)
             assert exc_info.value.error_code == "CONFIG_LOAD_FAILED"
     
     @pytest.mark.unit
@@ -51,114 +124,59 @@ class TestSDKClientErrorScenarios:
         with patch('src.sdk.client.get_config') as mock_get_config:
             mock_get_config.side_effect = yaml.YAMLError("Invalid YAML format")
             
-            with pytest.raises(ConfigError) as exc_info:
+            with pytest.raises(ConfigError, match="Failed to load configuration"):
                 GAMClient()
-            
-            assert "Failed to load configuration" in str(exc_info.value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
     def test_client_initialization_auth_manager_failure(self, mock_config):
         """Test client initialization when AuthManager fails."""
-        with patch('src.sdk.client.get_config') as mock_get_config, \
-             patch('src.sdk.client.AuthManager') as mock_auth_manager:
-            
-            mock_get_config.return_value = mock_config
+        with _patched_client_deps(mock_config) as (mock_get_config, mock_auth_manager):
             mock_auth_manager.side_effect = Exception("Auth manager initialization failed")
             
-            with pytest.raises(AuthError) as exc_info:
+            with pytest.raises(AuthError, match="Auto-authentication failed"):
                 GAMClient()
-            
-            assert "Auto-authentication failed" in str(exc_info.value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_ensure_authenticated_network_error(self, mock_config):
-        """Test _ensure_authenticated with network error."""
-        with patch('src.sdk.client.get_config') as mock_get_config, \
-             patch('src.sdk.client.AuthManager') as mock_auth_manager:
-            
-            mock_get_config.return_value = mock_config
-            mock_auth = Mock()
-            mock_auth_manager.return_value = mock_auth
-            
-            client = GAMClient(auto_authenticate=False)
-            client._authenticated = False
-            
-            # Mock network error during credential retrieval
-            mock_auth.get_oauth2_credentials.side_effect = requests.ConnectionError("Network unreachable")
-            
-            with pytest.raises(AuthError) as exc_info:
-                client._ensure_authenticated()
-            
-            assert "Authentication verification failed" in str(exc_info.value)
-    
-    @pytest.mark.unit
-    @pytest.mark.sdk
-    @pytest.mark.error
-    def test_ensure_authenticated_timeout_error(self, mock_config):
-        """Test _ensure_authenticated with timeout error."""
-        with patch('src.sdk.client.get_config') as mock_get_config, \
-             patch('src.sdk.client.AuthManager') as mock_auth_manager:
-            
-            mock_get_config.return_value = mock_config
-            mock_auth = Mock()
-            mock_auth_manager.return_value = mock_auth
-            
-            client = GAMClient(auto_authenticate=False)
-            client._authenticated = False
-            
-            # Mock timeout during credential retrieval
-            mock_auth.get_oauth2_credentials.side_effect = requests.Timeout("Request timeout")
-            
-            with pytest.raises(AuthError) as exc_info:
-                client._ensure_authenticated()
-            
-            assert "Authentication verification failed" in str(exc_info.value)
+    @pytest.mark.parametrize("error", [
+        requests.ConnectionError("Network unreachable"),
+        requests.Timeout("Request timeout"),
+    ], ids=["network_error", "timeout_error"])
+    def test_ensure_authenticated_request_error(self, patched_sdk_client, error):
+        """Test _ensure_authenticated when credential retrieval fails on the network."""
+        client = patched_sdk_client.client
+        patched_sdk_client.auth.get_oauth2_credentials.side_effect = error
+        
+        with pytest.raises(AuthError, match="Authentication verification failed"):
+            client._ensure_authenticated()
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_test_connection_authentication_failure(self, mock_config):
+    def test_test_connection_authentication_failure(self, patched_sdk_client):
         """Test test_connection when authentication fails."""
-        with patch('src.sdk.client.get_config') as mock_get_config, \
-             patch('src.sdk.client.AuthManager') as mock_auth_manager:
-            
-            mock_get_config.return_value = mock_config
-            mock_auth = Mock()
-            mock_auth_manager.return_value = mock_auth
-            
-            client = GAMClient(auto_authenticate=False)
+        client = patched_sdk_client.client
+        
+        # Mock authentication failure
+        with patch.object(client, '_ensure_authenticated', side_effect=AuthError("Auth failed")):
+            result = client.test_connection()
             
-            # Mock authentication failure
-            with patch.object(client, '_ensure_authenticated', side_effect=AuthError("Auth failed")):
-                result = client.test_connection()
-                
-                assert result['authenticated'] is False
-                assert result['overall_status'] == 'unauthenticated'
-                assert 'error' in result
+            assert result['authenticated'] is False
+            assert result['overall_status'] == 'unauthenticated'
+            assert 'error' in result
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_quick_report_invalid_report_type(self, mock_config):
+    def test_quick_report_invalid_report_type(self, patched_sdk_client):
         """Test quick_report with invalid report type."""
-        with patch('src.sdk.client.get_config') as mock_get_config, \
-             patch('src.sdk.client.AuthManager') as mock_auth_manager:
-            
-            mock_get_config.return_value = mock_config
-            mock_auth = Mock()
-            mock_auth_manager.return_value = mock_auth
-            
-            client = GAMClient(auto_authenticate=False)
-            
-            with pytest.raises(ValidationError) as exc_info:
-                client.quick_report('invalid_type')
-            
-            assert "Invalid quick report type" in str(exc_info.value)
-            assert exc_info.value.field_name == 'report_type'
+        with pytest.raises(ValidationError, match="Invalid quick report type") as exc_info:
+            patched_sdk_client.client.quick_report('invalid_type')
+        
+        assert exc_info.value.field_name == 'report_type'
 
 
 class TestReportBuilderErrorScenarios:
@@ -167,32 +185,25 @@ class TestReportBuilderErrorScenarios:
     @pytest.fixture
     def report_builder(self, mock_config):
         """Create a ReportBuilder instance."""
-        with patch('src.sdk.reports.ReportGenerator') as mock_generator:
-            mock_generator.return_value = Mock()
-            mock_auth = Mock()
+        generator = Mock(spec_set=_GENERATOR_METHODS)
+        mock_auth = Mock(spec_set=_AUTH_ATTRS)
+        with patch('src.sdk.reports.ReportGenerator', return_value=generator):
             return ReportBuilder(mock_config, mock_auth)
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_execute_no_dimensions_or_metrics(self, report_builder):
+    @pytest.mark.parametrize("dimensions,metrics,message", [
+        ([], ['IMPRESSIONS'], "At least one dimension is required"),
+        (['DATE'], [], "At least one metric is required"),
+    ], ids=["no_dimensions", "no_metrics"])
+    def test_execute_no_dimensions_or_metrics(self, report_builder, dimensions, metrics, message):
         """Test execute with no dimensions or metrics set."""
-        # Test no dimensions
-        report_builder._metrics = ['IMPRESSIONS']
-        
-        with pytest.raises(ValidationError) as exc_info:
-            report_builder.execute()
-        
-        assert "At least one dimension is required" in str(exc_info.value)
-        
-        # Test no metrics
-        report_builder._dimensions = ['DATE']
-        report_builder._metrics = []
+        report_builder._dimensions = dimensions
+        report_builder._metrics = metrics
         
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match=message):
             report_builder.execute()
-        
-        assert "At least one metric is required" in str(exc_info.value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
@@ -207,10 +218,8 @@ class TestReportBuilderErrorScenarios:
         invalid_end = date(2024, 1, 1)
         report_builder.date_range(invalid_start, invalid_end)
         
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="End date must be after start date"):
             report_builder.execute()
-        
-        assert "End date must be after start date" in str(exc_info.value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
@@ -224,10 +233,8 @@ class TestReportBuilderErrorScenarios:
         from gam_api.exceptions import TimeoutError as CoreTimeoutError
         report_builder._generator.create_report.side_effect = CoreTimeoutError("Operation timed out")
         
-        with pytest.raises(ReportError) as exc_info:
+        with pytest.raises(ReportError, match="Report generation failed"):
             report_builder.execute()
-        
-        assert "Report generation failed" in str(exc_info.value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
@@ -244,53 +251,37 @@ class TestReportBuilderErrorScenarios:
         
         report_builder._generator.create_report.side_effect = quota_error
         
-        with pytest.raises(ReportError) as exc_info:
+        with pytest.raises(ReportError, match="Report generation failed"):
             report_builder.execute()
-        
-        assert "Report generation failed" in str(exc_info.value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_days_back_invalid_value(self, report_builder):
+    @pytest.mark.parametrize("value,message", [
+        (-5, "Days back must be positive"),
+        (0, "Days back must be positive"),
+        (10000, "Days back cannot exceed"),
+    ], ids=["negative", "zero", "too_large"])
+    def test_days_back_invalid_value(self, report_builder, value, message):
         """Test days_back with invalid values."""
-        # Test negative days
-        with pytest.raises(ValidationError) as exc_info:
-            report_builder.days_back(-5)
-        
-        assert "Days back must be positive" in str(exc_info.value)
-        
-        # Test zero days
-        with pytest.raises(ValidationError) as exc_info:
-            report_builder.days_back(0)
-        
-        assert "Days back must be positive" in str(exc_info.value)
-        
-        # Test excessively large value
-        with pytest.raises(ValidationError) as exc_info:
-            report_builder.days_back(10000)
-        
-        assert "Days back cannot exceed" in str(exc_info.value)
+        with pytest.raises(ValidationError, match=message):
+            report_builder.days_back(value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
     def test_filter_invalid_operator(self, report_builder):
         """Test filter with invalid operator."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Invalid filter operator"):
             report_builder.filter('AD_UNIT_NAME', 'INVALID_OPERATOR', ['value'])
-        
-        assert "Invalid filter operator" in str(exc_info.value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
     def test_quick_report_type_invalid(self, report_builder):
         """Test quick report with invalid type."""
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="Invalid quick report type"):
             report_builder.quick('nonexistent_type')
-        
-        assert "Invalid quick report type" in str(exc_info.value)
 
 
 class TestReportResultErrorScenarios:
@@ -310,6 +301,11 @@ class TestReportResultErrorScenarios:
         ]
         return ReportResult(rows, ['DATE'], ['IMPRESSIONS'], {})
     
+    @pytest.fixture(scope="class")
+    def sample_result(self):
+        """Create a one-row ReportResult shared by the read-only tests."""
+        return ReportResult(list(_SAMPLE_ROWS), ['DATE', 'AD_UNIT_NAME'], ['IMPRESSIONS', 'CLICKS'], {})
+    
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
@@ -334,83 +330,42 @@ class TestReportResultErrorScenarios:
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_export_to_invalid_path(self, sample_report_data):
+    def test_export_to_invalid_path(self, sample_result, tmp_path):
         """Test export to invalid file path."""
-        rows = [
-            {
-                'dimensionValues': ['2024-01-01', 'Ad Unit 1'],
-                'metricValueGroups': [{'primaryValues': ['1000', '50']}]
-            }
-        ]
-        result = ReportResult(rows, ['DATE', 'AD_UNIT_NAME'], ['IMPRESSIONS', 'CLICKS'], {})
-        
-        # Test invalid directory
-        invalid_path = '/nonexistent/directory/file.csv'
-        
-        with pytest.raises(ReportError) as exc_info:
-            result.to_csv(invalid_path)
-        
-        assert "Failed to export report" in str(exc_info.value)
+        # Fail the open itself rather than relying on the filesystem layout
+        with patch('builtins.open', side_effect=FileNotFoundError("No such file or directory")):
+            with pytest.raises(ReportError, match="Failed to export report"):
+                sample_result.to_csv(tmp_path / 'file.csv')
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_export_permission_denied(self, sample_report_data):
+    def test_export_permission_denied(self, sample_result, tmp_path):
         """Test export when permission is denied."""
-        rows = [
-            {
-                'dimensionValues': ['2024-01-01', 'Ad Unit 1'],
-                'metricValueGroups': [{'primaryValues': ['1000', '50']}]
-            }
-        ]
-        result = ReportResult(rows, ['DATE', 'AD_UNIT_NAME'], ['IMPRESSIONS', 'CLICKS'], {})
-        
         # Mock permission error
-        with patch('pandas.DataFrame.to_csv', side_effect=PermissionError("Permission denied")):
-            with pytest.raises(ReportError) as exc_info:
-                result.to_csv('/tmp/test.csv')
-            
-            assert "Failed to export report" in str(exc_info.value)
+        with patch('builtins.open', side_effect=PermissionError("Permission denied")):
+            with pytest.raises(ReportError, match="Failed to export report"):
+                sample_result.to_csv(tmp_path / 'test.csv')
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_filter_invalid_function(self, sample_report_data):
+    def test_filter_invalid_function(self, sample_result):
         """Test filter with invalid function."""
-        rows = [
-            {
-                'dimensionValues': ['2024-01-01', 'Ad Unit 1'],
-                'metricValueGroups': [{'primaryValues': ['1000', '50']}]
-            }
-        ]
-        result = ReportResult(rows, ['DATE', 'AD_UNIT_NAME'], ['IMPRESSIONS', 'CLICKS'], {})
-        
         # Test with function that raises exception
         def bad_filter(row):
             raise ValueError("Filter error")
         
-        with pytest.raises(ReportError) as exc_info:
-            result.filter(bad_filter)
-        
-        assert "Filter operation failed" in str(exc_info.value)
+        with pytest.raises(ReportError, match="Filter operation failed"):
+            sample_result.filter(bad_filter)
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_sort_invalid_column(self, sample_report_data):
+    def test_sort_invalid_column(self, sample_result):
         """Test sort with non-existent column."""
-        rows = [
-            {
-                'dimensionValues': ['2024-01-01', 'Ad Unit 1'],
-                'metricValueGroups': [{'primaryValues': ['1000', '50']}]
-            }
-        ]
-        result = ReportResult(rows, ['DATE', 'AD_UNIT_NAME'], ['IMPRESSIONS', 'CLICKS'], {})
-        
-        with pytest.raises(ReportError) as exc_info:
-            result.sort('NONEXISTENT_COLUMN')
-        
-        assert "Sort operation failed" in str(exc_info.value)
+        with pytest.raises(ReportError, match="Sort operation failed"):
+            sample_result.sort('NONEXISTENT_COLUMN')
 
 
 class TestConfigManagerErrorScenarios:
@@ -419,58 +374,41 @@ class TestConfigManagerErrorScenarios:
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_load_from_corrupted_yaml(self):
+    def test_load_from_corrupted_yaml(self, tmp_path):
         """Test loading from corrupted YAML file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("invalid: yaml: content: [unclosed")
-            corrupted_path = f.name
+        corrupted_path = tmp_path / "corrupted.yaml"
+        corrupted_path.write_text("invalid: yaml: content: [unclosed")
         
-        try:
-            manager = ConfigManager()
-            
-            with pytest.raises(ConfigError) as exc_info:
-                manager.load_from_file(corrupted_path)
-            
-            assert "Failed to load configuration" in str(exc_info.value)
-            
-        finally:
-            os.unlink(corrupted_path)
+        manager = ConfigManager()
+        
+        with pytest.raises(ConfigError, match="Failed to load configuration"):
+            manager.load_from_file(corrupted_path)
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_load_from_corrupted_json(self):
+    def test_load_from_corrupted_json(self, tmp_path):
         """Test loading from corrupted JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write('{"invalid": json, "content"}')
-            corrupted_path = f.name
+        corrupted_path = tmp_path / "corrupted.json"
+        corrupted_path.write_text('{"invalid": json, "content"}')
         
-        try:
-            manager = ConfigManager()
-            
-            with pytest.raises(ConfigError) as exc_info:
-                manager.load_from_file(corrupted_path)
-            
-            assert "Failed to load configuration" in str(exc_info.value)
-            
-        finally:
-            os.unlink(corrupted_path)
+        manager = ConfigManager()
+        
+        with pytest.raises(ConfigError, match="Failed to load configuration"):
+            manager.load_from_file(corrupted_path)
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_save_to_readonly_directory(self):
+    def test_save_to_readonly_directory(self, tmp_path):
         """Test saving to read-only directory."""
         manager = ConfigManager()
         manager.set('test.key', 'test_value')
         
-        # Try to save to root directory (should fail with permission error)
-        readonly_path = '/etc/readonly_config.yaml'
-        
-        with pytest.raises(ConfigError) as exc_info:
-            manager.save_to_file(readonly_path)
-        
-        assert "Failed to save configuration" in str(exc_info.value)
+        # Deny the write itself; directory permissions do not stop root in CI
+        with patch('builtins.open', side_effect=PermissionError("Permission denied")):
+            with pytest.raises(ConfigError, match="Failed to save configuration"):
+                manager.save_to_file(tmp_path / 'readonly_config.yaml')
     
     @pytest.mark.unit
     @pytest.mark.sdk
@@ -482,10 +420,8 @@ class TestConfigManagerErrorScenarios:
         # Mock missing network code
         with patch.object(manager, 'get', side_effect=lambda key, default=None: None if 'network_code' in key else 'value'):
             
-            with pytest.raises(ConfigError) as exc_info:
+            with pytest.raises(ConfigError, match="Configuration validation failed"):
                 manager.validate()
-            
-            assert "Configuration validation failed" in str(exc_info.value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
@@ -495,16 +431,14 @@ class TestConfigManagerErrorScenarios:
         manager = ConfigManager(mock_config)
         
         with patch('src.sdk.config.AuthManager') as mock_auth_manager:
-            mock_auth = Mock()
+            mock_auth = Mock(spec_set=_AUTH_ATTRS)
             mock_auth_manager.return_value = mock_auth
             
             # Mock network failure
             mock_auth.get_oauth2_credentials.side_effect = requests.ConnectionError("Network error")
             
-            with pytest.raises(ConfigError) as exc_info:
+            with pytest.raises(ConfigError, match="Connection test failed"):
                 manager.test_connection()
-            
-            assert "Connection test failed" in str(exc_info.value)
 
 
 class TestAuthManagerErrorScenarios:
@@ -512,9 +446,16 @@ class TestAuthManagerErrorScenarios:
     
     @pytest.fixture
     def auth_manager(self, mock_config):
-        """Create an AuthManager instance."""
-        mock_core_auth = Mock()
-        return SDKAuthManager(mock_config, mock_core_auth)
+        """Create an AuthManager instance with its own core auth mock."""
+        return SDKAuthManager(mock_config, Mock(spec_set=_AUTH_ATTRS))
+    
+    @pytest.fixture
+    def expired_creds(self, auth_manager, mock_oauth_credentials):
+        """Attach expired credentials to the auth manager."""
+        mock_oauth_credentials.expired = True
+        auth_manager._credentials = mock_oauth_credentials
+        auth_manager._core_auth._get_request.return_value = Mock()
+        return mock_oauth_credentials
     
     @pytest.mark.unit
     @pytest.mark.sdk
@@ -533,33 +474,16 @@ class TestAuthManagerErrorScenarios:
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.error
-    def test_refresh_if_needed_network_error(self, auth_manager, mock_oauth_credentials):
-        """Test refresh_if_needed with network error during refresh."""
-        mock_oauth_credentials.expired = True
-        mock_oauth_credentials.refresh.side_effect = requests.ConnectionError("Network unreachable")
-        auth_manager._credentials = mock_oauth_credentials
-        auth_manager._core_auth._get_request.return_value = Mock()
-        
-        with pytest.raises(AuthError) as exc_info:
-            auth_manager.refresh_if_needed()
-        
-        assert "Failed to refresh credentials" in str(exc_info.value)
-    
-    @pytest.mark.unit
-    @pytest.mark.sdk
-    @pytest.mark.error
-    def test_refresh_if_needed_invalid_response(self, auth_manager, mock_oauth_credentials):
-        """Test refresh_if_needed with invalid server response."""
-        mock_oauth_credentials.expired = True
-        # Mock invalid response from Google's servers
-        mock_oauth_credentials.refresh.side_effect = ValueError("Invalid response format")
-        auth_manager._credentials = mock_oauth_credentials
-        auth_manager._core_auth._get_request.return_value = Mock()
+    @pytest.mark.parametrize("error", [
+        requests.ConnectionError("Network unreachable"),
+        ValueError("Invalid response format"),
+    ], ids=["network_error", "invalid_response"])
+    def test_refresh_if_needed_failure(self, auth_manager, expired_creds, error):
+        """Test refresh_if_needed when the token refresh fails."""
+        expired_creds.refresh.side_effect = error
         
-        with pytest.raises(AuthError) as exc_info:
+        with pytest.raises(AuthError, match="Failed to refresh credentials"):
             auth_manager.refresh_if_needed()
-        
-        assert "Failed to refresh credentials" in str(exc_info.value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
@@ -568,10 +492,8 @@ class TestAuthManagerErrorScenarios:
         """Test login when browser is not available."""
         with patch('src.sdk.auth.webbrowser.open', side_effect=Exception("No browser available")):
             
-            with pytest.raises(AuthError) as exc_info:
+            with pytest.raises(AuthError, match="Login flow failed"):
                 auth_manager.login()
-            
-            assert "Login flow failed" in str(exc_info.value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
@@ -601,10 +523,8 @@ class TestAuthManagerErrorScenarios:
             mock_session.get.side_effect = requests.Timeout("REST timeout")
             auth_manager._core_auth.get_rest_session.return_value = mock_session
             
-            with pytest.raises(NetworkError) as exc_info:
+            with pytest.raises(NetworkError, match="Both API connections failed"):
                 auth_manager.test_connection()
-            
-            assert "Both API connections failed" in str(exc_info.value)
     
     @pytest.mark.unit
     @pytest.mark.sdk
@@ -627,15 +547,22 @@ class TestEdgeCaseScenarios:
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.edge_case
-    def test_extremely_large_report_data(self):
-        """Test handling of extremely large report datasets."""
-        # Create very large dataset (10,000 rows)
-        rows = []
-        for i in range(10000):
-            rows.append({
-                'dimensionValues': [f'2024-01-{(i % 31) + 1:02d}', f'Ad Unit {i}'],
-                'metricValueGroups': [{'primaryValues': [str(1000000 + i), str(50000 + i)]}]
-            })
+    @pytest.mark.slow
+    def test_extremely_large_report_data(self, n_rows):
+        """Test handling of extremely large report datasets (10,000 rows with --slow)."""
+        # Build each column's strings in one vectorized pass, then zip into rows
+        i = np.arange(n_rows)
+        dates = np.char.add('2024-01-', np.char.zfill(((i % 31) + 1).astype(str), 2))
+        ad_units = np.char.add('Ad Unit ', i.astype(str))
+        impressions = (1000000 + i).astype(str)
+        clicks = (50000 + i).astype(str)
+        rows = [
+            {
+                'dimensionValues': [d, u],
+                'metricValueGroups': [{'primaryValues': [imp, clk]}]
+            }
+            for d, u, imp, clk in zip(dates.tolist(), ad_units.tolist(), impressions.tolist(), clicks.tolist())
+        ]
         
         result = ReportResult(
             rows,
@@ -645,15 +572,15 @@ class TestEdgeCaseScenarios:
         )
         
         # Should handle large dataset without memory issues
-        assert len(result) == 10000
+        assert len(result) == n_rows
         
         # Test DataFrame conversion with large data
         df = result.to_dataframe()
-        assert len(df) == 10000
+        assert len(df) == n_rows
         
         # Test filtering with large data
-        filtered = result.filter(lambda row: row.get('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 0) > 1005000)
-        assert len(filtered) < 10000
+        filtered = result.filter(lambda row: row.get('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 0) > 1000000 + n_rows // 2)
+        assert 0 < len(filtered) < n_rows
     
     @pytest.mark.unit
     @pytest.mark.sdk
@@ -687,20 +614,14 @@ class TestEdgeCaseScenarios:
         assert len(df) == 3
         
         # Test CSV export with Unicode
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            csv_path = f.name
+        buffer = io.StringIO()
+        result.to_csv(buffer)
+        buffer.seek(0)
         
-        try:
-            result.to_csv(csv_path)
-            assert os.path.exists(csv_path)
-            
-            # Verify Unicode is preserved
-            import pandas as pd
-            imported_df = pd.read_csv(csv_path)
-            assert '🚀' in imported_df.iloc[0]['AD_UNIT_NAME']
-            
-        finally:
-            os.unlink(csv_path)
+        # Verify Unicode is preserved
+        import pandas as pd
+        imported_df = pd.read_csv(buffer)
+        assert '🚀' in imported_df.iloc[0]['AD_UNIT_NAME']
     
     @pytest.mark.unit
     @pytest.mark.sdk
@@ -734,25 +655,18 @@ class TestEdgeCaseScenarios:
         assert len(df) == 3
         
         # Check that null values are handled properly
+        import pandas as pd
         assert df.iloc[1]['AD_UNIT_NAME'] is None or pd.isna(df.iloc[1]['AD_UNIT_NAME'])
     
     @pytest.mark.unit
     @pytest.mark.sdk
     @pytest.mark.edge_case
-    def test_date_boundary_conditions(self, mock_config):
+    def test_date_boundary_conditions(self, patched_sdk_client):
         """Test date boundary conditions."""
-        with patch('src.sdk.client.get_config') as mock_get_config, \
-             patch('src.sdk.client.AuthManager') as mock_auth_manager, \
-             patch('src.sdk.reports.ReportGenerator') as mock_generator_class:
-            
-            mock_get_config.return_value = mock_config
-            mock_auth = Mock()
-            mock_auth_manager.return_value = mock_auth
-            mock_generator = Mock()
-            mock_generator_class.return_value = mock_generator
+        with patch('src.sdk.reports.ReportGenerator') as mock_generator_class:
+            mock_generator_class.return_value = Mock()
             
-            client = GAMClient(auto_authenticate=False)
-            builder = client.reports()
+            builder = patched_sdk_client.client.reports()
             
             # Test leap year dates
             leap_start = date(2024, 2, 29)  # Valid leap year date
@@ -3,9 +3,12 @@ Unit tests for the core models module.
 """
 
 import pytest
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import List, Dict
 
+from gam_api import models as core_models
 from gam_api.models import (
     ReportType,
     DateRangeType,
@@ -21,6 +24,39 @@ from gam_api.models import (
 )
 
 
+@contextmanager
+def _freeze_models_datetime(fixed_dt):
+    """Make ``datetime.now()`` inside the models module return ``fixed_dt``."""
+    original = core_models.datetime
+    core_models.datetime = SimpleNamespace(now=lambda tz=None: fixed_dt)
+    try:
+        yield
+    finally:
+        core_models.datetime = original
+
+
+@pytest.fixture(scope="module")
+def shared_date_range():
+    """Custom January 2024 date range shared by read-only tests."""
+    return DateRange(
+        start_date="2024-01-01",
+        end_date="2024-01-31",
+        date_range_type=DateRangeType.CUSTOM
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_report_def(shared_date_range):
+    """Fully specified report definition shared by read-only tests."""
+    return ReportDefinition(
+        name="Test Report",
+        dimensions=["DATE", "AD_UNIT_NAME"],
+        metrics=["IMPRESSIONS", "CLICKS"],
+        date_range=shared_date_range,
+        filters=[{"field": "AD_UNIT_NAME", "operator": "CONTAINS", "value": "Mobile"}]
+    )
+
+
 class TestReportType:
     """Test cases for ReportType enum."""
     
@@ -63,17 +99,11 @@ class TestDateRangeType:
 class TestDateRange:
     """Test cases for DateRange class."""
     
-    def test_init_with_dates(self):
+    def test_init_with_dates(self, shared_date_range):
         """Test DateRange initialization with start and end dates."""
-        date_range = DateRange(
-            start_date="2024-01-01",
-            end_date="2024-01-31",
-            date_range_type=DateRangeType.CUSTOM
-        )
-        
-        assert date_range.start_date == "2024-01-01"
-        assert date_range.end_date == "2024-01-31"
-        assert date_range.date_range_type == DateRangeType.CUSTOM
+        assert shared_date_range.start_date == "2024-01-01"
+        assert shared_date_range.end_date == "2024-01-31"
+        assert shared_date_range.date_range_type == DateRangeType.CUSTOM
     
     def test_init_with_defaults(self):
         """Test DateRange initialization with defaults."""
@@ -85,12 +115,8 @@ class TestDateRange:
     
     def test_last_n_days(self):
         """Test creating date range for last N days."""
-        # Mock datetime to have consistent test
-        from unittest.mock import patch
-        with patch('src.core.models.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 1, 31, 12, 0, 0)
-            mock_datetime.strftime = datetime.strftime
-            
+        # Freeze the clock to have consistent test
+        with _freeze_models_datetime(datetime(2024, 1, 31, 12, 0, 0)):
             date_range = DateRange.last_n_days(7)
             
             assert date_range.start_date == "2024-01-24"
@@ -99,11 +125,7 @@ class TestDateRange:
     
     def test_last_n_days_various_values(self):
         """Test last_n_days with various day values."""
-        from unittest.mock import patch
-        with patch('src.core.models.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 2, 15, 0, 0, 0)
-            mock_datetime.strftime = datetime.strftime
-            
+        with _freeze_models_datetime(datetime(2024, 2, 15, 0, 0, 0)):
             # Test 1 day
             date_range = DateRange.last_n_days(1)
             assert date_range.start_date == "2024-02-14"
@@ -118,24 +140,14 @@ class TestDateRange:
 class TestReportDefinition:
     """Test cases for ReportDefinition class."""
     
-    def test_init_with_all_params(self):
+    def test_init_with_all_params(self, shared_report_def, shared_date_range):
         """Test ReportDefinition initialization with all parameters."""
-        date_range = DateRange(start_date="2024-01-01", end_date="2024-01-31")
-        
-        report_def = ReportDefinition(
-            name="Test Report",
-            dimensions=["DATE", "AD_UNIT_NAME"],
-            metrics=["IMPRESSIONS", "CLICKS"],
-            date_range=date_range,
-            filters=[{"field": "AD_UNIT_NAME", "operator": "CONTAINS", "value": "Mobile"}]
-        )
-        
-        assert report_def.name == "Test Report"
-        assert report_def.dimensions == ["DATE", "AD_UNIT_NAME"]
-        assert report_def.metrics == ["IMPRESSIONS", "CLICKS"]
-        assert report_def.date_range == date_range
-        assert len(report_def.filters) == 1
-        assert report_def.filters[0]["field"] == "AD_UNIT_NAME"
+        assert shared_report_def.name == "Test Report"
+        assert shared_report_def.dimensions == ["DATE", "AD_UNIT_NAME"]
+        assert shared_report_def.metrics == ["IMPRESSIONS", "CLICKS"]
+        assert shared_report_def.date_range == shared_date_range
+        assert len(shared_report_def.filters) == 1
+        assert shared_report_def.filters[0]["field"] == "AD_UNIT_NAME"
     
     def test_init_with_defaults(self):
         """Test ReportDefinition initialization with defaults."""
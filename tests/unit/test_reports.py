@@ -3,8 +3,8 @@ Unit tests for the core reports module.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, date, timedelta
+from types import SimpleNamespace
 
 from gam_api.reports import (
     ReportGenerator,
@@ -20,6 +20,10 @@ from gam_api.exceptions import (
 )
 
 
+# Quick report types in definition order, fixed at import for parametrization
+_QUICK_REPORT_TYPES = tuple(QUICK_REPORTS)
+
+
 class TestQuickReports:
     """Test cases for quick reports configuration."""
 
@@ -51,74 +55,32 @@ class TestQuickReports:
 class TestReportGenerator:
     """Test cases for ReportGenerator class."""
 
-    def test_init_without_client(self):
+    @pytest.fixture(scope="class")
+    def generator(self):
+        """ReportGenerator without a client, shared by the stateless report tests."""
+        return ReportGenerator()
+
+    def test_init_without_client(self, generator):
         """Test ReportGenerator initialization without client."""
-        generator = ReportGenerator()
         assert generator.client is None
 
     def test_init_with_client(self):
         """Test ReportGenerator initialization with client."""
-        mock_client = Mock()
-        generator = ReportGenerator(client=mock_client)
-        assert generator.client == mock_client
-
-    def test_generate_quick_report_delivery(self):
-        """Test generating a delivery quick report."""
-        generator = ReportGenerator()
-        result = generator.generate_quick_report('delivery')
-
-        assert isinstance(result, dict)
-        assert result['report_type'] == 'delivery'
-        assert result['status'] == 'completed'
+        client = SimpleNamespace()
+        generator = ReportGenerator(client=client)
+        assert generator.client is client
 
-    def test_generate_quick_report_inventory(self):
-        """Test generating an inventory quick report."""
-        generator = ReportGenerator()
-        result = generator.generate_quick_report('inventory')
+    @pytest.mark.parametrize("report_type", _QUICK_REPORT_TYPES)
+    def test_generate_quick_report(self, generator, report_type):
+        """Test generating each quick report type."""
+        result = generator.generate_quick_report(report_type)
 
         assert isinstance(result, dict)
-        assert result['report_type'] == 'inventory'
+        assert result['report_type'] == report_type
         assert result['status'] == 'completed'
 
-    def test_generate_quick_report_sales(self):
-        """Test generating a sales quick report."""
-        generator = ReportGenerator()
-        result = generator.generate_quick_report('sales')
-
-        assert isinstance(result, dict)
-        assert result['report_type'] == 'sales'
-        assert result['status'] == 'completed'
-
-    def test_generate_quick_report_reach(self):
-        """Test generating a reach quick report."""
-        generator = ReportGenerator()
-        result = generator.generate_quick_report('reach')
-
-        assert isinstance(result, dict)
-        assert result['report_type'] == 'reach'
-        assert result['status'] == 'completed'
-
-    def test_generate_quick_report_programmatic(self):
-        """Test generating a programmatic quick report."""
-        generator = ReportGenerator()
-        result = generator.generate_quick_report('programmatic')
-
-        assert isinstance(result, dict)
-        assert result['report_type'] == 'programmatic'
-        assert result['status'] == 'completed'
-
-    def test_generate_quick_report_all_types(self):
-        """Test all quick report types are handled."""
-        generator = ReportGenerator()
-
-        for report_type in QUICK_REPORTS.keys():
-            result = generator.generate_quick_report(report_type)
-            assert isinstance(result, dict)
-            assert result['report_type'] == report_type
-
-    def test_generate_quick_report_with_kwargs(self):
+    def test_generate_quick_report_with_kwargs(self, generator):
         """Test generate_quick_report accepts kwargs."""
-        generator = ReportGenerator()
         result = generator.generate_quick_report('delivery', days_back=7, format='csv')
 
         assert isinstance(result, dict)
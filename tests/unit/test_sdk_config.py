@@ -121,6 +121,18 @@ class TestConfigManagerGetSet:
         
         assert result is config_manager
         assert config_manager._changes == config_dict
+    
+    @pytest.mark.unit
+    @pytest.mark.sdk
+    def test_set_many_method(self, config_manager):
+        """Test set_many records all changes in one call."""
+        updates = {f'test.setting_{i}': f'value_{i}' for i in range(100)}
+        
+        result = config_manager.set_many(updates)
+        
+        assert result is config_manager
+        assert config_manager._changes == updates
+        assert config_manager.get('test.setting_42') == 'value_42'
 
 
 class TestConfigManagerFileOperations:
@@ -112,6 +112,18 @@ class TestReportResult:
         # Should return the same object (cached)
         assert df1 is df2
     
+    @pytest.mark.unit
+    @pytest.mark.sdk
+    def test_to_dataframe_cache_is_read_only(self, sample_report_data):
+        """Test that the cached DataFrame cannot be mutated in place."""
+        df = sample_report_data.to_dataframe()
+        
+        impressions = df['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'].to_numpy()
+        with pytest.raises(ValueError):
+            impressions[0] = 0
+        
+        assert sample_report_data.to_dataframe().iloc[0]['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'] == 1000
+    
     @pytest.mark.unit
     @pytest.mark.sdk
     def test_to_csv_export(self, sample_report_data, temp_report_file):
@@ -134,6 +146,23 @@ class TestReportResult:
         # Cleanup
         os.unlink(csv_path)
     
+    @pytest.mark.unit
+    @pytest.mark.sdk
+    def test_to_csv_writes_missing_values_as_empty(self, tmp_path):
+        """Test missing dimension and metric values are exported as empty fields."""
+        rows = [
+            {'dimensionValues': ['2024-01-01', 'Ad Unit 1'], 'metricValueGroups': [{'primaryValues': ['1000']}]},
+            {'dimensionValues': ['2024-01-02'], 'metricValueGroups': [{'primaryValues': []}]}
+        ]
+        result = ReportResult(rows, ['DATE', 'AD_UNIT_NAME'], ['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'])
+        csv_path = tmp_path / "report.csv"
+        
+        result.to_csv(csv_path)
+        
+        lines = csv_path.read_text().splitlines()
+        assert len(lines) == 3
+        assert lines[2] == '2024-01-02,,'
+    
     @pytest.mark.unit
     @pytest.mark.sdk
     def test_to_json_export_records(self, sample_report_data, temp_report_file):
@@ -220,6 +249,21 @@ class TestReportResult:
         assert filtered.dimension_headers == sample_report_data.dimension_headers
         assert filtered.metric_headers == sample_report_data.metric_headers
     
+    @pytest.mark.unit
+    @pytest.mark.sdk
+    def test_filter_defers_column_gather(self, sample_report_data):
+        """Test that filtered results only hold a mask until data is needed."""
+        filtered = sample_report_data.filter(
+            lambda row: row.get('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 0) > 1500
+        )
+        
+        assert filtered._columns is None
+        assert filtered.row_count == 1
+        assert filtered._columns is None
+        
+        assert filtered.rows[0]['dimensionValues'] == ['2024-01-02', 'Ad Unit 2']
+        assert filtered.row_count == 1
+    
     @pytest.mark.unit
     @pytest.mark.sdk
     def test_sort_method(self, sample_report_data):
@@ -235,6 +279,70 @@ class TestReportResult:
         assert df.iloc[0]['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'] == 2000
         assert df.iloc[1]['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'] == 1000
     
+    @pytest.mark.unit
+    @pytest.mark.sdk
+    @pytest.mark.parametrize("ascending,expected_dates", [
+        (True, ['2024-01-03', '2024-01-01', '2024-01-02', '2024-01-04']),
+        (False, ['2024-01-01', '2024-01-03', '2024-01-02', '2024-01-04']),
+    ])
+    def test_sort_places_missing_values_last(self, ascending, expected_dates):
+        """Test rows with missing sort values end up last in both directions."""
+        rows = [
+            {'dimensionValues': ['2024-01-01', 'Ad Unit B'], 'metricValueGroups': [{'primaryValues': ['2000']}]},
+            {'dimensionValues': ['2024-01-02'], 'metricValueGroups': [{'primaryValues': []}]},
+            {'dimensionValues': ['2024-01-03', 'Ad Unit A'], 'metricValueGroups': [{'primaryValues': ['1000']}]},
+            {'dimensionValues': ['2024-01-04'], 'metricValueGroups': [{'primaryValues': []}]}
+        ]
+        result = ReportResult(rows, ['DATE', 'AD_UNIT_NAME'], ['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'])
+        
+        by_dimension = result.sort('AD_UNIT_NAME', ascending=ascending)
+        by_metric = result.sort('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', ascending=ascending)
+        
+        assert by_dimension.column_values('DATE').tolist() == expected_dates
+        assert by_metric.column_values('DATE').tolist() == expected_dates
+    
+    @pytest.mark.unit
+    @pytest.mark.sdk
+    def test_column_values_method(self, sample_report_data):
+        """Test column_values returns the backing column without a DataFrame."""
+        impressions = sample_report_data.column_values('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS')
+        
+        assert impressions.tolist() == [1000, 2000]
+        assert not impressions.flags.writeable
+        assert sample_report_data._dataframe is None
+        
+        with pytest.raises(ReportError):
+            sample_report_data.column_values('MISSING_COLUMN')
+    
+    @pytest.mark.unit
+    @pytest.mark.sdk
+    def test_top_k_method(self, sample_report_data):
+        """Test top_k matches filter + sort + head."""
+        top = sample_report_data.top_k('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 1)
+        assert len(top) == 1
+        assert top.to_dataframe().iloc[0]['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'] == 2000
+        
+        bottom = sample_report_data.top_k('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 5, ascending=True)
+        assert bottom.to_dataframe()['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'].tolist() == [1000, 2000]
+        
+        filtered = sample_report_data.top_k(
+            'TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 5, predicate=('lt', 1500)
+        )
+        assert filtered.to_dataframe()['DATE'].tolist() == ['2024-01-01']
+    
+    @pytest.mark.unit
+    @pytest.mark.sdk
+    def test_top_k_invalid_arguments(self, sample_report_data):
+        """Test top_k argument validation."""
+        with pytest.raises(ValidationError):
+            sample_report_data.top_k('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', -1)
+        
+        with pytest.raises(ValidationError):
+            sample_report_data.top_k('TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS', 1, predicate=('between', 1))
+        
+        with pytest.raises(ReportError):
+            sample_report_data.top_k('MISSING_COLUMN', 1)
+    
     @pytest.mark.unit
     @pytest.mark.sdk
     def test_head_method(self, sample_report_data):
@@ -271,6 +379,37 @@ class TestReportResult:
         assert summary['column_count'] == 4
         assert 'TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS' in summary['numeric_columns']
     
+    @pytest.mark.unit
+    @pytest.mark.sdk
+    def test_summary_includes_metric_with_missing_values(self):
+        """Test metric columns with missing values stay numeric."""
+        rows = [
+            {'dimensionValues': ['2024-01-01'], 'metricValueGroups': [{'primaryValues': ['1000']}]},
+            {'dimensionValues': ['2024-01-02'], 'metricValueGroups': [{'primaryValues': []}]}
+        ]
+        result = ReportResult(rows, ['DATE'], ['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'])
+        
+        df = result.to_dataframe()
+        
+        assert df['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'].dtype == 'float64'
+        assert pd.isna(df.iloc[1]['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'])
+        assert result.summary()['numeric_columns'] == ['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS']
+    
+    @pytest.mark.unit
+    @pytest.mark.sdk
+    def test_metric_too_large_for_int64(self):
+        """Test metric values beyond int64 keep their exact integer value."""
+        rows = [
+            {'dimensionValues': ['2024-01-01'], 'metricValueGroups': [{'primaryValues': ['99999999999999999999']}]},
+            {'dimensionValues': ['2024-01-02'], 'metricValueGroups': [{'primaryValues': ['5']}]}
+        ]
+        result = ReportResult(rows, ['DATE'], ['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'])
+        
+        df = result.to_dataframe()
+        
+        assert df.iloc[0]['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'] == 99999999999999999999
+        assert df.iloc[1]['TOTAL_LINE_ITEM_LEVEL_IMPRESSIONS'] == 5
+    
     @pytest.mark.unit
     @pytest.mark.sdk
     def test_len_method(self, sample_report_data):